@@ -0,0 +1,215 @@
+"""Benchmark the favorites store, services and platform entities.
+
+For every combination of user count and favorites per user, the store is
+filled and each service is called repeatedly through its registered handler
+with a save delay of 0, so every call pays for its own write. The entities
+are updated from the change event the way the platforms do it, and their
+attributes are serialized the way the state machine would.
+
+Per service the results hold ops/sec, p50/p99 latency, bytes persisted per
+call, and bytes of state attributes and event data produced per change. The
+results are written as JSON; pass a previous run with --baseline to flag
+ops/sec regressions.
+
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --users 1,10 --items 10,100 --baseline results.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from standin import ROOT, async_setup, favorites
+
+from favorites.binary_sensor import FavoritesActiveSensor
+from favorites.sensor import FavoritesSensor, FavoritesUserSensor
+
+DOMAINS = ("light", "switch", "cover", "climate", "fan")
+SERVICES = ("add", "remove", "toggle", "update", "reorder", "move", "add_many")
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
+
+
+def _entity_id(user: int, index: int) -> str:
+    return f"{DOMAINS[index % len(DOMAINS)]}.bench_{user}_{index}"
+
+
+def _service_data(
+    service: str, rng: random.Random, store: favorites.FavoritesStore, user_id: str, user: int, fresh: int
+) -> dict[str, Any]:
+    entity_ids = store.get_user_entity_ids(user_id)
+    data: dict[str, Any] = {"user_id": user_id}
+    if service == "add":
+        data["entity_id"] = _entity_id(user, fresh)
+    elif service == "add_many":
+        data["entity_ids"] = [_entity_id(user, fresh + i) for i in range(10)]
+    elif service == "reorder":
+        # One tile dragged to the front, sent as the full list
+        moved = rng.randrange(len(entity_ids))
+        data["entity_ids"] = [entity_ids[moved], *entity_ids[:moved], *entity_ids[moved + 1:]]
+    elif service == "move":
+        # The same drag, sent the way the card does it now
+        data["entity_id"] = rng.choice(entity_ids)
+        data["position"] = 0
+    else:
+        data["entity_id"] = rng.choice(entity_ids)
+    if service == "update":
+        data["custom_name"] = f"Renamed {fresh}"
+    return data
+
+
+async def async_bench_cell(users: int, items: int, ops: int, seed: int, sharded: bool) -> dict[str, Any]:
+    rng = random.Random(seed)
+    hass, store = await async_setup(save_delay=0, sharded=sharded)
+    user_ids = [f"user_{u}" for u in range(users)]
+    for u, user_id in enumerate(user_ids):
+        await store.async_apply(
+            user_id, [{"op": "add", "entity_id": _entity_id(u, i)} for i in range(items)]
+        )
+
+    list_sensor = FavoritesSensor(hass, store)
+    active_sensor = FavoritesActiveSensor(store)
+    user_sensors = {user_id: FavoritesUserSensor(store, user_id) for user_id in user_ids}
+    sizes = {"attributes": 0, "event": 0}
+
+    def on_changed(event: Any) -> None:
+        # What the platforms do per change: update and write their state
+        user_sensor = user_sensors[event.data["user_id"]]
+        for entity in (list_sensor, user_sensor):
+            entity._update_native_value()
+            sizes["attributes"] += len(json.dumps(entity.extra_state_attributes))
+        active_sensor._update_state()
+        sizes["event"] += len(json.dumps(event.data))
+
+    hass.bus.async_listen(favorites.EVENT_FAVORITES_CHANGED, on_changed)
+
+    results = {}
+    fresh = items
+    for service in SERVICES:
+        latencies = []
+        writes = bytes_written = changes = 0
+        sizes.update(attributes=0, event=0)
+        for _ in range(ops):
+            u = rng.randrange(users)
+            data = _service_data(service, rng, store, user_ids[u], u, fresh)
+            fresh += 10
+            before = (hass.writes, hass.bytes_written, hass.bus.fired)
+            start = time.perf_counter()
+            await hass.services.async_call(favorites.DOMAIN, service, data)
+            latencies.append(time.perf_counter() - start)
+            writes += hass.writes - before[0]
+            bytes_written += hass.bytes_written - before[1]
+            changes += hass.bus.fired - before[2]
+            if service in ("remove", "toggle") and not store.is_favorite(user_ids[u], data["entity_id"]):
+                # Put it back untimed so the list keeps its size
+                await store.async_add(user_ids[u], data["entity_id"])
+
+        changes = max(1, changes)
+        total = sum(latencies)
+        results[service] = {
+            "ops_per_sec": round(ops / total, 1),
+            "p50_ms": round(_percentile(latencies, 0.50) * 1000, 3),
+            "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+            "writes_per_op": round(writes / ops, 2),
+            "bytes_persisted_per_op": round(bytes_written / ops),
+            "attribute_bytes_per_change": round(sizes["attributes"] / changes),
+            "event_bytes_per_change": round(sizes["event"] / changes),
+        }
+
+    return {
+        "users": users,
+        "items": items,
+        "layout": "sharded" if sharded else "single",
+        "services": results,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return a line for every service that got slower than the threshold."""
+    def key(cell: dict[str, Any]) -> tuple:
+        return cell["users"], cell["items"], cell["layout"]
+
+    old_cells = {key(cell): cell for cell in baseline["cells"]}
+    regressions = []
+    for cell in results["cells"]:
+        if (old := old_cells.get(key(cell))) is None:
+            continue
+        for service, numbers in cell["services"].items():
+            if (old_numbers := old["services"].get(service)) is None:
+                continue
+            ratio = numbers["ops_per_sec"] / old_numbers["ops_per_sec"]
+            if ratio < 1 - threshold:
+                regressions.append(
+                    f"{cell['layout']} {cell['users']}x{cell['items']} {service}: "
+                    f"{old_numbers['ops_per_sec']} -> {numbers['ops_per_sec']} ops/s"
+                )
+    return regressions
+
+
+async def async_main(args: argparse.Namespace) -> int:
+    manifest = json.loads((ROOT / "custom_components" / "favorites" / "manifest.json").read_text())
+    results: dict[str, Any] = {
+        "version": manifest["version"],
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "ops_per_service": args.ops,
+        "seed": args.seed,
+        "cells": [],
+    }
+
+    for layout in args.layouts:
+        for users in args.users:
+            for items in args.items:
+                cell = await async_bench_cell(users, items, args.ops, args.seed, layout == "sharded")
+                results["cells"].append(cell)
+                summary = ", ".join(
+                    f"{service} {numbers['ops_per_sec']}/s"
+                    for service, numbers in cell["services"].items()
+                )
+                print(f"{layout} {users} users x {items} items: {summary}", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION: {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=_int_list, default=[1, 10, 50])
+    parser.add_argument("--items", type=_int_list, default=[10, 100, 1000], help="favorites per user")
+    parser.add_argument("--layouts", type=lambda v: v.split(","), default=["single"], help="single,sharded")
+    parser.add_argument("--ops", type=int, default=100, help="calls per service and cell")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--baseline", help="earlier results to compare ops/sec against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%")
+    sys.exit(asyncio.run(async_main(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""In-memory stand-in for the parts of Home Assistant the integration touches.
+
+Used by the scripts in this directory to drive FavoritesStore, the service
+handlers and the platform entities without a running Home Assistant. The
+``homeassistant`` package must be importable (``pip install homeassistant``)
+for the integration's own imports and service schemas; only the runtime
+objects (event loop plumbing, bus, services, storage) are replaced here.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "custom_components"))
+
+import favorites  # noqa: E402
+
+
+class MemoryStore:
+    """Drop-in for helpers.storage.Store that keeps JSON in hass.storage."""
+
+    def __init__(self, hass: FakeHass, version: int, key: str, **kwargs: Any) -> None:
+        self.hass = hass
+        self.key = key
+        self._delayed: asyncio.TimerHandle | None = None
+
+    async def async_load(self) -> Any:
+        await asyncio.sleep(0)
+        if (raw := self.hass.storage.get(self.key)) is None:
+            return None
+        return json.loads(raw)
+
+    def _write(self, data: Any) -> None:
+        raw = json.dumps(data)
+        self.hass.storage[self.key] = raw
+        self.hass.writes += 1
+        self.hass.bytes_written += len(raw)
+
+    async def async_save(self, data: Any) -> None:
+        if self._delayed is not None:
+            self._delayed.cancel()
+            self._delayed = None
+        # Real saves hand off to the executor; yield so callers interleave
+        await asyncio.sleep(0)
+        self._write(data)
+
+    def async_delay_save(self, data_func: Callable[[], Any], delay: float = 0) -> None:
+        if self._delayed is not None:
+            self._delayed.cancel()
+
+        def write() -> None:
+            self._delayed = None
+            self._write(data_func())
+
+        self._delayed = asyncio.get_running_loop().call_later(delay, write)
+
+    async def async_remove(self) -> None:
+        self.hass.storage.pop(self.key, None)
+
+
+class FakeBus:
+    def __init__(self) -> None:
+        self._listeners: dict[str, list[Callable]] = {}
+        self.fired = 0
+
+    def async_fire(self, event_type: str, event_data: dict[str, Any] | None = None) -> None:
+        self.fired += 1
+        event = SimpleNamespace(event_type=event_type, data=event_data or {})
+        for listener in list(self._listeners.get(event_type, ())):
+            if asyncio.iscoroutine(result := listener(event)):
+                asyncio.get_running_loop().create_task(result)
+
+    def async_listen(self, event_type: str, listener: Callable, *args: Any) -> Callable[[], None]:
+        self._listeners.setdefault(event_type, []).append(listener)
+        return lambda: self._listeners[event_type].remove(listener)
+
+    async_listen_once = async_listen
+
+
+class FakeServices:
+    def __init__(self) -> None:
+        self._services: dict[tuple[str, str], tuple[Callable, Any]] = {}
+
+    def async_register(
+        self, domain: str, service: str, handler: Callable, schema: Any = None, **kwargs: Any
+    ) -> None:
+        self._services[(domain, service)] = (handler, schema)
+
+    def has_service(self, domain: str, service: str) -> bool:
+        return (domain, service) in self._services
+
+    async def async_call(
+        self, domain: str, service: str, data: dict[str, Any], **kwargs: Any
+    ) -> Any:
+        handler, schema = self._services[(domain, service)]
+        return await handler(
+            SimpleNamespace(
+                data=schema(data) if schema else data,
+                # Calls without a context run as the system, like automations
+                context=kwargs.get("context") or SimpleNamespace(user_id=None),
+            )
+        )
+
+
+class FakeHass:
+    def __init__(self) -> None:
+        self.bus = FakeBus()
+        self.services = FakeServices()
+        self.data: dict[str, Any] = {}
+        self.storage: dict[str, str] = {}
+        self.writes = 0
+        self.bytes_written = 0
+
+    def async_create_task(self, target: Any, *args: Any) -> asyncio.Task:
+        return asyncio.get_running_loop().create_task(target)
+
+
+favorites.Store = favorites.FavoritesStorage = MemoryStore
+favorites.usage.Store = MemoryStore
+favorites.shared.Store = MemoryStore
+
+
+async def async_setup(
+    save_delay: float = 0, sharded: bool = False, storage: dict[str, str] | None = None
+) -> tuple[FakeHass, favorites.FavoritesStore]:
+    """Return a stand-in hass with a loaded store and registered services.
+
+    ``storage`` seeds the stand-in's files, e.g. with another run's storage.
+    """
+    hass = FakeHass()
+    hass.storage.update(storage or {})
+    store = favorites.FavoritesStore(hass, save_delay, sharded=sharded)
+    await store.async_load()
+    hass.data[favorites.DOMAIN] = {"store": store}
+    await favorites.async_register_services(hass, store)
+    return hass, store
+
+
+def check_consistency(store: favorites.FavoritesStore) -> list[str]:
+    """Compare the store's indexes and counters with its item lists."""
+    errors = []
+    domains: dict[str, int] = {}
+    total = 0
+    for user_id, items in store.users.items():
+        entity_ids = [item["entity_id"] for item in items]
+        if len(entity_ids) != len(set(entity_ids)):
+            errors.append(f"{user_id}: duplicate entity ids")
+        orders = [item["order"] for item in items]
+        if any(a >= b for a, b in zip(orders, orders[1:])) or (orders and orders[0] <= 0):
+            errors.append(f"{user_id}: order keys are not positive and increasing")
+        if any(value is None for item in items for value in item.values()):
+            errors.append(f"{user_id}: items store null fields")
+        indexed = store._items_by_user.get(user_id, {})
+        if set(indexed) != set(entity_ids):
+            errors.append(f"{user_id}: index does not match items")
+        if any(indexed.get(item["entity_id"]) is not item for item in items):
+            errors.append(f"{user_id}: index points at stale items")
+        if store.user_counts.get(user_id, 0) != len(items):
+            errors.append(f"{user_id}: user count {store.user_counts.get(user_id)} != {len(items)}")
+        for entity_id in entity_ids:
+            if user_id not in store.get_entity_users(entity_id):
+                errors.append(f"{user_id}: {entity_id} missing from entity index")
+            domain = entity_id.split(".")[0]
+            domains[domain] = domains.get(domain, 0) + 1
+        total += len(items)
+    if store.total_count != total:
+        errors.append(f"total_count {store.total_count} != {total}")
+    if dict(store.domain_counts) != domains:
+        errors.append(f"domain_counts {dict(store.domain_counts)} != {domains}")
+    return errors
@@ -0,0 +1,183 @@
+"""Fire thousands of concurrent favorites service calls and check the result.
+
+Every user gets a random sequence of add/remove/toggle/update/reorder calls,
+all started at once with asyncio.gather. Afterwards the store must be
+internally consistent, match what was persisted, have fired gap-free
+revisions per user, and hold the same favorites as a sequential replay of
+the same calls (reorders aside, which may be coalesced). With --shared,
+every user first subscribes to a shared list holding part of the pool, and
+each merged view must list the user's own favorites first, then the list.
+
+    python benchmarks/stress_mutations.py --users 5 --calls 2000 [--sharded] [--shared]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Any
+
+from standin import async_setup, check_consistency, favorites
+
+DOMAINS = ("light", "switch", "cover", "climate", "fan")
+SERVICES = ("add", "remove", "toggle", "update", "reorder", "move")
+
+
+def make_calls(rng: random.Random, user_id: str, count: int, pool: int) -> list[tuple[str, dict]]:
+    entity_ids = [f"{DOMAINS[i % len(DOMAINS)]}.stress_{i}" for i in range(pool)]
+    calls = []
+    for i in range(count):
+        service = rng.choices(SERVICES, weights=(4, 3, 3, 1, 1, 2))[0]
+        data: dict[str, Any] = {"user_id": user_id}
+        if service == "reorder":
+            data["entity_ids"] = rng.sample(entity_ids, k=pool // 2)
+        elif service == "move":
+            data["entity_id"] = rng.choice(entity_ids)
+            data["position"] = rng.randrange(pool)
+        else:
+            data["entity_id"] = rng.choice(entity_ids)
+        if service == "update":
+            data["custom_name"] = f"name {i}"
+        calls.append((service, data))
+    return calls
+
+
+def snapshot(store: favorites.FavoritesStore) -> dict[str, dict[str, Any]]:
+    return {
+        user_id: {item["entity_id"]: item.get("custom_name") for item in store.get_user_view(user_id)}
+        for user_id in store.users
+    }
+
+
+async def async_subscribe_all(
+    hass: Any,
+    store: favorites.FavoritesStore,
+    user_ids: list[str],
+    entity_ids: list[str],
+    own_ids: list[str],
+) -> list[str]:
+    """Subscribe every user to one shared list and check the merged order."""
+    await hass.services.async_call(
+        favorites.DOMAIN, "shared_add", {"list_id": "stress", "entity_ids": entity_ids}
+    )
+    errors = []
+    for user_id in user_ids:
+        # A few own favorites first, so there is something to merge with
+        await hass.services.async_call(
+            favorites.DOMAIN, "add_many", {"user_id": user_id, "entity_ids": own_ids}
+        )
+        await hass.services.async_call(
+            favorites.DOMAIN, "subscribe", {"user_id": user_id, "list_id": "stress"}
+        )
+        own = store.get_user_entity_ids(user_id)
+        expected = own + [entity_id for entity_id in entity_ids if entity_id not in own]
+        if store.get_view_entity_ids(user_id) != expected:
+            errors.append(f"{user_id}: view after subscribing is not own favorites, then the list")
+    return errors
+
+
+async def async_run(args: argparse.Namespace) -> int:
+    rng = random.Random(args.seed)
+    per_user = {
+        f"user_{u}": make_calls(rng, f"user_{u}", args.calls, args.pool)
+        for u in range(args.users)
+    }
+
+    seed = None
+    if args.sharded:
+        # Start from shards that are not loaded yet, so the first calls of
+        # every user race the lazy load
+        seed_hass, seed_store = await async_setup(sharded=True)
+        for user_id in per_user:
+            await seed_store.async_add(user_id, "light.stress_0")
+        seed = seed_hass.storage
+
+    hass, store = await async_setup(save_delay=args.save_delay, sharded=args.sharded, storage=seed)
+    errors: list[str] = []
+    # Every fourth entity of the pool, so some are also the users' own
+    shared = [f"{DOMAINS[i % len(DOMAINS)]}.stress_{i}" for i in range(0, args.pool, 4)]
+    own = [f"{DOMAINS[i % len(DOMAINS)]}.stress_{i}" for i in range(1, 8, 2)]
+    if args.shared:
+        errors += await async_subscribe_all(hass, store, list(per_user), shared, own)
+    first_revisions = {user_id: store.get_revision(user_id) + 1 for user_id in per_user}
+    revisions: dict[str, list[int]] = {}
+    actions: dict[str, int] = {}
+
+    def record(event: Any) -> None:
+        revisions.setdefault(event.data["user_id"], []).append(event.data["revision"])
+        actions[event.data["action"]] = actions.get(event.data["action"], 0) + 1
+
+    hass.bus.async_listen(favorites.EVENT_FAVORITES_CHANGED, record)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        hass.services.async_call(favorites.DOMAIN, service, data)
+        for calls in per_user.values()
+        for service, data in calls
+    ))
+    elapsed = time.perf_counter() - start
+    await store.async_flush()
+    await asyncio.sleep(args.save_delay + 0.05)
+
+    errors += check_consistency(store)
+
+    for user_id, items in store.users.items():
+        if args.sharded:
+            persisted = json.loads(hass.storage[f"{favorites.STORAGE_KEY}.{user_id}"])["items"]
+        else:
+            persisted = json.loads(hass.storage[favorites.STORAGE_KEY])["users"].get(user_id, [])
+        if [item["entity_id"] for item in persisted] != [
+            item["entity_id"] for item in items
+        ]:
+            errors.append(f"{user_id}: persisted list differs from memory")
+
+    for user_id, seen in revisions.items():
+        first = first_revisions[user_id]
+        if seen != list(range(first, first + len(seen))):
+            errors.append(f"{user_id}: revisions are not gap-free and increasing")
+
+    # The per-user lock applies calls in the order they were made, so a
+    # sequential replay must end with the same favorites
+    replay_hass, replay_store = await async_setup(
+        save_delay=args.save_delay, sharded=args.sharded, storage=seed
+    )
+    if args.shared:
+        await async_subscribe_all(replay_hass, replay_store, list(per_user), shared, own)
+    for calls in per_user.values():
+        for service, data in calls:
+            await replay_hass.services.async_call(favorites.DOMAIN, service, data)
+    if snapshot(store) != snapshot(replay_store):
+        errors.append("concurrent result differs from sequential replay")
+
+    reorders = sum(1 for calls in per_user.values() for service, _ in calls if service == "reorder")
+    applied = sum(len(seen) for seen in revisions.values())
+    total = args.users * args.calls
+    print(
+        f"{total} calls for {args.users} users in {elapsed:.3f}s "
+        f"({total / elapsed:.0f} calls/s), {hass.writes} writes, "
+        f"{applied} change events, {actions.get('reorder', 0)} of {reorders} reorders applied"
+    )
+    for error in errors:
+        print(f"FAIL: {error}")
+    if not errors:
+        print("OK")
+    return 1 if errors else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--calls", type=int, default=2000, help="calls per user")
+    parser.add_argument("--pool", type=int, default=40, help="distinct entities per user")
+    parser.add_argument("--save-delay", type=float, default=0)
+    parser.add_argument("--sharded", action="store_true", help="use the sharded storage layout")
+    parser.add_argument("--shared", action="store_true", help="subscribe every user to a shared list")
+    parser.add_argument("--seed", type=int, default=1)
+    sys.exit(asyncio.run(async_run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,32 +4,78 @@ Provides a HomeKit-like favorites system with per-user support.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AsyncExitStack
 from datetime import datetime
 from typing import Any
 import os  # Moved to top
+from time import perf_counter
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.const import (
+    EVENT_CALL_SERVICE,
+    EVENT_HOMEASSISTANT_STOP,
+    STATE_UNAVAILABLE,
+    Platform,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, Unauthorized, UnknownUser
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import async_get_integration
+
+from .assets import CardAssetView, prepare_card_files
+from .metrics import FavoritesMetrics
+from .shared import SharedLists
+from .transfer import async_export, async_import, resolve_path
+from .usage import FavoritesUsage
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "favorites"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 STORAGE_KEY = DOMAIN
+# Gap between neighbouring order keys; a moved favorite takes the midpoint
+# of its new neighbours, so only its own record changes
+ORDER_STEP = 1 << 16
+
+CONF_SAVE_DELAY = "save_delay"
+DEFAULT_SAVE_DELAY = 2  # seconds; 0 writes through on every mutation
+CONF_EVENT_FORMAT = "event_format"
+CONF_STORAGE_LAYOUT = "storage_layout"
+STORAGE_LAYOUT_SINGLE = "single"
+STORAGE_LAYOUT_SHARDED = "sharded"
+DEFAULT_STORAGE_LAYOUT = STORAGE_LAYOUT_SINGLE
+EVENT_FORMAT_FULL = "full"
+EVENT_FORMAT_DELTA = "delta"
+DEFAULT_EVENT_FORMAT = EVENT_FORMAT_FULL
+CONF_DEBUG_METRICS = "debug_metrics"
+DEFAULT_DEBUG_METRICS = False
+CONF_RECORDER_FRIENDLY = "recorder_friendly"
+DEFAULT_RECORDER_FRIENDLY = False
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR]
 
 # --- ADDED: CONSTANTS FOR ASSET SERVING ---
 ASSET_URL_PATH = f"/{DOMAIN}_static"
+CARD_FILES = ("favoritable-card.js", "favorites-grid-card.js")
 # ------------------------------------------
 
 SERVICE_ADD = "add"
@@ -38,33 +84,307 @@ SERVICE_TOGGLE = "toggle"
 SERVICE_REORDER = "reorder"
 SERVICE_CLEAR = "clear"
 SERVICE_UPDATE = "update"
+SERVICE_ADD_MANY = "add_many"
+SERVICE_REMOVE_MANY = "remove_many"
+SERVICE_APPLY = "apply"
+SERVICE_GET = "get"
+SERVICE_PURGE_HISTORY = "purge_history"
+SERVICE_CONTROL = "control"
+SERVICE_EXPORT = "export"
+SERVICE_MOVE = "move"
+SERVICE_IMPORT = "import"
+SERVICE_SHARED_ADD = "shared_add"
+SERVICE_SHARED_REMOVE = "shared_remove"
+SERVICE_SHARED_DELETE = "shared_delete"
+SERVICE_SUBSCRIBE = "subscribe"
+SERVICE_UNSUBSCRIBE = "unsubscribe"
 
 ATTR_ENTITY_ID = "entity_id"
 ATTR_USER_ID = "user_id"
 ATTR_CUSTOM_NAME = "custom_name"
 ATTR_CUSTOM_ICON = "custom_icon"
 ATTR_ENTITY_IDS = "entity_ids"
+ATTR_OPERATIONS = "operations"
+ATTR_OP = "op"
+ATTR_KEEP_DAYS = "keep_days"
+ATTR_ACTION = "action"
+ATTR_DOMAIN = "domain"
+ATTR_AREA_ID = "area_id"
+ATTR_ORDER_BY = "order_by"
+ATTR_PATH = "path"
+ATTR_POSITION = "position"
+ATTR_USER_MAP = "user_map"
+ATTR_SKIP_MISSING = "skip_missing"
+ATTR_BATCH_SIZE = "batch_size"
+ATTR_LIST_ID = "list_id"
+ATTR_NAME = "name"
+
+# Export and import only touch .ndjson files in this directory of the config directory
+EXPORT_DIR = "favorites_exports"
+DEFAULT_EXPORT_PATH = "favorites_export.ndjson"  # relative to EXPORT_DIR
+DEFAULT_IMPORT_BATCH_SIZE = 500
+
+OPS = ("add", "remove", "toggle", "update")
+
+CONTROL_ACTIONS = ("turn_on", "turn_off", "toggle")
+_ON_OFF_SERVICES = {action: action for action in CONTROL_ACTIONS}
+# domain -> control action -> service; favorites in other domains are skipped
+CONTROL_SERVICES: dict[str, dict[str, str]] = {
+    **dict.fromkeys(
+        ("automation", "climate", "fan", "humidifier", "input_boolean", "light",
+         "media_player", "script", "siren", "switch"),
+        _ON_OFF_SERVICES,
+    ),
+    "cover": {"turn_on": "open_cover", "turn_off": "close_cover", "toggle": "toggle"},
+    "valve": {"turn_on": "open_valve", "turn_off": "close_valve", "toggle": "toggle"},
+    "scene": {"turn_on": "turn_on"},
+}
+
+GROUP_BY_AREA = "area"
+GROUP_BY_DOMAIN = "domain"
+
+ORDER_BY_MANUAL = "order"
+ORDER_BY_USAGE = "usage"
 
 EVENT_FAVORITES_CHANGED = "favorites_changed"
 
 
+def _summarize(items: list[dict[str, Any]]) -> dict[str, Any]:
+    """Summarize a user's items for the sharded manifest."""
+    domains: dict[str, int] = {}
+    areas: dict[str, int] = {}
+    for item in items:
+        _bump_count(domains, item["entity_id"].split(".", 1)[0], 1)
+        if area_id := item.get("area_id"):
+            _bump_count(areas, area_id, 1)
+    return {
+        "count": len(items),
+        "domains": domains,
+        "areas": areas,
+        "entity_ids": [item["entity_id"] for item in items],
+    }
+
+
+def _set_field(item: dict[str, Any], key: str, value: Any) -> None:
+    """Set an optional item field; None removes it, as items never store nulls."""
+    if value is None:
+        item.pop(key, None)
+    else:
+        item[key] = value
+
+
+def _next_order(items: list[dict[str, Any]]) -> int:
+    return items[-1].get("order", 0) + ORDER_STEP if items else ORDER_STEP
+
+
+def _fit_order(items: list[dict[str, Any]], index: int) -> bool:
+    """Give items[index] an order key between its neighbours' keys.
+
+    Returns False if they are adjacent and there is no key left between them.
+    """
+    low = items[index - 1]["order"] if index > 0 else 0
+    if index + 1 == len(items):
+        items[index]["order"] = low + ORDER_STEP
+        return True
+    high = items[index + 1]["order"]
+    if high - low < 2:
+        return False
+    items[index]["order"] = (low + high) // 2
+    return True
+
+
+def _renumber(items: list[dict[str, Any]]) -> None:
+    """Spread the order keys evenly again, once a gap has run out."""
+    for i, item in enumerate(items):
+        item["order"] = (i + 1) * ORDER_STEP
+
+
+def _reassign_orders(items: list[dict[str, Any]]) -> None:
+    """Make the order keys increase along items, changing as few as possible.
+
+    The longest run of items whose keys already increase keeps its keys;
+    the others are spread over the gaps between them.
+    """
+    keys = [item.get("order") for item in items]
+    # Longest strictly increasing subsequence, O(n log n)
+    tails: list[int] = []
+    tail_keys: list[int] = []
+    previous = [-1] * len(items)
+    for i, key in enumerate(keys):
+        if not isinstance(key, int):
+            continue
+        pos = bisect_left(tail_keys, key)
+        previous[i] = tails[pos - 1] if pos else -1
+        if pos == len(tails):
+            tails.append(i)
+            tail_keys.append(key)
+        else:
+            tails[pos] = i
+            tail_keys[pos] = key
+    keep: set[int] = set()
+    i = tails[-1] if tails else -1
+    while i != -1:
+        keep.add(i)
+        i = previous[i]
+
+    low = 0
+    run: list[dict[str, Any]] = []
+    for i, item in enumerate([*items, None]):
+        if item is not None and i not in keep:
+            run.append(item)
+            continue
+        if run:
+            if item is None:
+                step = ORDER_STEP
+            elif (step := (item["order"] - low) // (len(run) + 1)) < 1:
+                _renumber(items)
+                return
+            for k, moved in enumerate(run, 1):
+                moved["order"] = low + k * step
+            run = []
+        if item is not None:
+            low = item["order"]
+
+
+def _migrate_items_v1(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop null fields and replace the dense 0..n-1 order with sparse keys."""
+    ordered = sorted(items, key=lambda item: item.get("order") or 0)
+    return [
+        {
+            **{key: value for key, value in item.items() if value is not None},
+            "order": (i + 1) * ORDER_STEP,
+        }
+        for i, item in enumerate(ordered)
+    ]
+
+
+class FavoritesStorage(Store):
+    """Store for the favorites files, migrating them to STORAGE_VERSION."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        if old_major_version < 2:
+            _LOGGER.info("Migrating %s to compact items with sparse ordering", self.key)
+            if "users" in old_data:
+                old_data = {
+                    **old_data,
+                    "users": {
+                        user_id: _migrate_items_v1(items)
+                        for user_id, items in old_data["users"].items()
+                    },
+                }
+            elif "items" in old_data:
+                # A user shard, or the single list from before per-user support
+                old_data = {**old_data, "items": _migrate_items_v1(old_data["items"])}
+        return old_data
+
+
+def _bump_count(counts: dict[str, int], key: str, delta: int) -> None:
+    if (count := counts.get(key, 0) + delta) > 0:
+        counts[key] = count
+    else:
+        counts.pop(key, None)
+
+
 class FavoritesStore:
     """Manage favorites storage with per-user support."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        save_delay: float = DEFAULT_SAVE_DELAY,
+        sharded: bool = False,
+    ) -> None:
         """Initialize the store."""
         self.hass = hass
-        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._store: Store = FavoritesStorage(hass, STORAGE_VERSION, STORAGE_KEY)
         self._data: dict[str, Any] = {"users": {}}
+        # user_id -> entity_id -> item, and entity_id -> user_ids; kept in sync with _data
+        self._items_by_user: dict[str, dict[str, dict[str, Any]]] = {}
+        self._users_by_entity: dict[str, set[str]] = {}
+        # Running totals, updated with the indexes so readers never have to sum
+        self.total_count = 0
+        self._user_counts: dict[str, int] = {}
+        self._domain_counts: dict[str, int] = {}
+        self._area_counts: dict[str, int] = {}
+        # user_id -> "area"/"domain" -> key -> entity_ids, for grouped views
+        self._groups: dict[str, dict[str, dict[str | None, set[str]]]] = {}
+        self.save_delay = save_delay
+        self.event_format = DEFAULT_EVENT_FORMAT
+        # Keep the item lists out of states and events, so the recorder
+        # only ever sees numbers
+        self.recorder_friendly = DEFAULT_RECORDER_FRIENDLY
+        self._dirty = False
+        self.pending_saves = 0
+        self.flush_count = 0
+        # Sharded layout: the main store only holds a manifest with a summary
+        # per user, and each user's items live in their own store file
+        self.sharded = sharded
+        self._shards: dict[str, Store] = {}
+        self._summaries: dict[str, dict[str, Any]] = {}
+        self._unloaded: set[str] = set()
+        # entity_id -> unloaded users whose shard has it once the journal is
+        # replayed, so registry changes are only journaled for those users;
+        # users whose summary has no entity list yet get every change
+        self._unloaded_by_entity: dict[str, set[str]] = {}
+        self._unloaded_unindexed: set[str] = set()
+        self._dirty_users: set[str] = set()
+        self._load_tasks: dict[str, asyncio.Task] = {}
+        # Set once the main store file has been read; async_start_load does
+        # that in the background so setup does not wait on disk
+        self.loaded = False
+        self._load_task: asyncio.Task | None = None
+        # Mutations of one user run one at a time, in call order; different
+        # users never wait on each other
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._pending_reorders: dict[str, list[str]] = {}
+        # Registry changes seen while some shards were still unloaded, each
+        # with the users it still has to be replayed for when their shard
+        # loads; saved in the manifest so a restart does not lose them
+        self._registry_journal: list[dict[str, Any]] = []
+        # user_id -> last revision sent in a change event
+        self._announced: dict[str, int] = {}
+        self.metrics = FavoritesMetrics()
+        self.usage = FavoritesUsage(hass, f"{STORAGE_KEY}_usage")
+        # Shared lists live in their own file whatever the layout, so each
+        # list is stored once however many users subscribe to it
+        self.shared = SharedLists(hass, f"{STORAGE_KEY}_shared")
+
+    @callback
+    def async_start_load(self) -> None:
+        """Start loading in the background; callers wait in async_wait_loaded."""
+        self._load_task = self.hass.async_create_background_task(
+            self.async_load(), f"{DOMAIN} store load"
+        )
+
+    async def async_wait_loaded(self) -> None:
+        """Wait for the load started by async_start_load to finish."""
+        if not self.loaded and self._load_task is not None:
+            # Shielded, so a cancelled caller does not cancel the load
+            await asyncio.shield(self._load_task)
 
     async def async_load(self) -> None:
         """Load data from storage."""
+        await self.usage.async_load()
+        await self.shared.async_load()
         data = await self._store.async_load()
+        if data and "shards" in data:
+            if self.sharded:
+                self._load_manifest(data)
+            else:
+                await self._async_migrate_from_shards(data)
+            self._rebuild_index()
+            self._announced = dict(self._data.get("revisions", {}))
+            self.loaded = True
+            return
+
         if data:
             if "items" in data and "users" not in data:
                 _LOGGER.info("Migrating favorites to per-user format")
                 self._data = {"users": {"migrated_default": data["items"]}}
-                await self.async_save()
+                if not self.sharded:
+                    await self.async_save()
             elif "users" in data:
                 self._data = data
             else:
@@ -72,13 +392,374 @@ class FavoritesStore:
         else:
             self._data = {"users": {}}
 
+        if self.sharded:
+            await self._async_migrate_to_shards()
+        self._rebuild_index()
+        self._announced = dict(self._data.get("revisions", {}))
+        self.loaded = True
+
+    def _shard(self, user_id: str) -> Store:
+        if (shard := self._shards.get(user_id)) is None:
+            shard = self._shards[user_id] = FavoritesStorage(
+                self.hass, STORAGE_VERSION, f"{STORAGE_KEY}.{user_id}"
+            )
+        return shard
+
+    def _load_manifest(self, data: dict[str, Any]) -> None:
+        """Load the sharded manifest; user shards are loaded on first access."""
+        self._data = {"users": {}, "revisions": data.get("revisions", {})}
+        self._summaries = data["shards"]
+        self._unloaded = set(self._summaries)
+        self._registry_journal = data.get("journal", [])
+        self._unloaded_by_entity = {}
+        self._unloaded_unindexed = set()
+        for user_id, summary in self._summaries.items():
+            if (entity_ids := summary.get("entity_ids")) is None:
+                self._unloaded_unindexed.add(user_id)
+                continue
+            for entity_id in entity_ids:
+                self._unloaded_by_entity.setdefault(entity_id, set()).add(user_id)
+        for entry in self._registry_journal:
+            self._track_journaled(entry["change"], entry["entity_ids"], set(entry["users"]))
+
+    async def _async_migrate_to_shards(self) -> None:
+        """Split the single-file data into one shard per user plus a manifest."""
+        _LOGGER.info("Migrating favorites to sharded per-user storage")
+        for user_id, items in self._data["users"].items():
+            await self._shard(user_id).async_save({"items": items})
+            self._summaries[user_id] = _summarize(items)
+        await self._store.async_save(self._manifest_data())
+
+    async def _async_migrate_from_shards(self, data: dict[str, Any]) -> None:
+        """Merge every user shard back into a single file."""
+        _LOGGER.info("Migrating favorites from sharded to single-file storage")
+        users: dict[str, list[dict[str, Any]]] = {}
+        for user_id in data["shards"]:
+            shard_data = await self._shard(user_id).async_load()
+            users[user_id] = (shard_data or {}).get("items", [])
+        self._data = {"users": users, "revisions": data.get("revisions", {})}
+        # Registry changes that some shards never saw are applied now
+        self._registry_journal = data.get("journal", [])
+        if self._registry_journal:
+            self._rebuild_index()
+            for user_id in {user for entry in self._registry_journal for user in entry["users"]}:
+                self._replay_registry_journal(user_id)
+        await self.async_save()
+        for user_id in data["shards"]:
+            await self._shard(user_id).async_remove()
+        self._shards = {}
+
+    def is_user_loaded(self, user_id: str) -> bool:
+        """Return whether a user's favorites are in memory."""
+        return user_id not in self._unloaded
+
+    async def async_ensure_loaded(self, user_id: str) -> None:
+        """Load a user's shard if it has not been loaded yet."""
+        if not self.loaded:
+            await self.async_wait_loaded()
+        if user_id not in self._unloaded:
+            return
+        if (task := self._load_tasks.get(user_id)) is None:
+            task = self._load_tasks[user_id] = self.hass.async_create_task(
+                self._async_load_shard(user_id)
+            )
+        await task
+
+    async def _async_load_shard(self, user_id: str) -> None:
+        try:
+            shard_data = await self._shard(user_id).async_load()
+        finally:
+            self._load_tasks.pop(user_id, None)
+        if user_id not in self._unloaded:
+            return
+
+        # Swap the manifest summary in the running totals for the real items
+        self._count_summary(user_id, self._summaries[user_id], -1)
+        self._unloaded.discard(user_id)
+        items = (shard_data or {}).get("items", [])
+        self._data["users"] = {**self._data.get("users", {}), user_id: items}
+        self._user_counts[user_id] = 0
+        for item in items:
+            self._index_item(user_id, item)
+
+        journal_size = len(self._registry_journal)
+        changed = self._replay_registry_journal(user_id)
+        self._unloaded_unindexed.discard(user_id)
+        for entity_id in {
+            *self._summaries[user_id].get("entity_ids", ()), *self._items_by_user.get(user_id, {})
+        }:
+            if (holders := self._unloaded_by_entity.get(entity_id)) is not None:
+                holders.discard(user_id)
+                if not holders:
+                    del self._unloaded_by_entity[entity_id]
+        if changed:
+            await self.async_schedule_save(user_id)
+            async_fire_changed_event(self.hass, self, "batch", user_id, None, changed)
+        elif len(self._registry_journal) != journal_size:
+            await self.async_schedule_save()
+
+    def _count_summary(self, user_id: str, summary: dict[str, Any], delta: int) -> None:
+        count = summary.get("count", 0)
+        self.total_count += delta * count
+        self._user_counts[user_id] = self._user_counts.get(user_id, 0) + delta * count
+        for domain, domain_count in summary.get("domains", {}).items():
+            _bump_count(self._domain_counts, domain, delta * domain_count)
+        for area_id, area_count in summary.get("areas", {}).items():
+            _bump_count(self._area_counts, area_id, delta * area_count)
+
+    def _manifest_data(self) -> dict[str, Any]:
+        for user_id in self._dirty_users:
+            self._summaries[user_id] = _summarize(self.get_user_items(user_id))
+        return {
+            "shards": self._summaries,
+            "revisions": self._data.get("revisions", {}),
+            "journal": self._registry_journal,
+        }
+
+    def _shard_data(self, user_id: str) -> dict[str, Any]:
+        items = self.get_user_items(user_id)
+        self._summaries[user_id] = _summarize(items)
+        return {"items": items}
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the lookup indexes from the loaded data."""
+        self._items_by_user = {}
+        self._users_by_entity = {}
+        self.total_count = 0
+        self._user_counts = {}
+        self._domain_counts = {}
+        self._area_counts = {}
+        self._groups = {}
+        for user_id, items in self._data.get("users", {}).items():
+            self._user_counts[user_id] = 0
+            for item in items:
+                self._index_item(user_id, item)
+        for user_id in self._unloaded:
+            self._count_summary(user_id, self._summaries[user_id], 1)
+
+    def _index_item(self, user_id: str, item: dict[str, Any]) -> None:
+        user_items = self._items_by_user.setdefault(user_id, {})
+        if (previous := user_items.get(item["entity_id"])) is not None:
+            self._count_item(user_id, previous, -1)
+        user_items[item["entity_id"]] = item
+        self._users_by_entity.setdefault(item["entity_id"], set()).add(user_id)
+        self._count_item(user_id, item, 1)
+
+    def _unindex_item(self, user_id: str, entity_id: str) -> None:
+        if (item := self._items_by_user.get(user_id, {}).pop(entity_id, None)) is None:
+            return
+        self._count_item(user_id, item, -1)
+        self.usage.forget(user_id, entity_id)
+        if (user_ids := self._users_by_entity.get(entity_id)) is not None:
+            user_ids.discard(user_id)
+            if not user_ids:
+                del self._users_by_entity[entity_id]
+
+    def _count_item(self, user_id: str, item: dict[str, Any], delta: int) -> None:
+        """Add (delta=1) or remove (delta=-1) an item from the running totals."""
+        entity_id = item["entity_id"]
+        domain = entity_id.split(".", 1)[0]
+        area_id = item.get("area_id")
+        self.total_count += delta
+        self._user_counts[user_id] = self._user_counts.get(user_id, 0) + delta
+        _bump_count(self._domain_counts, domain, delta)
+        if area_id:
+            _bump_count(self._area_counts, area_id, delta)
+
+        groups = self._groups.setdefault(user_id, {GROUP_BY_AREA: {}, GROUP_BY_DOMAIN: {}})
+        for group_by, key in ((GROUP_BY_AREA, area_id), (GROUP_BY_DOMAIN, domain)):
+            if delta > 0:
+                groups[group_by].setdefault(key, set()).add(entity_id)
+            elif (members := groups[group_by].get(key)) is not None:
+                members.discard(entity_id)
+                if not members:
+                    del groups[group_by][key]
+
+    def get_groups(
+        self, user_id: str, group_by: str
+    ) -> dict[str | None, list[dict[str, Any]]]:
+        """Return a user's favorites grouped by area or domain.
+
+        Groups come from an index kept up to date on every change; items in a
+        group keep the user's order. Items without an area are under None.
+        Users with shared lists have their merged view grouped instead.
+        """
+        if self.shared.lists_for(user_id):
+            groups: dict[str | None, list[dict[str, Any]]] = {}
+            for item in self.get_user_view(user_id):
+                key = (
+                    item.get("area_id") if group_by == GROUP_BY_AREA
+                    else item["entity_id"].split(".", 1)[0]
+                )
+                groups.setdefault(key, []).append(item)
+            return groups
+
+        index = self._items_by_user.get(user_id, {})
+        return {
+            key: sorted(
+                (index[entity_id] for entity_id in members),
+                key=lambda item: item.get("order", 0),
+            )
+            for key, members in self._groups.get(user_id, {}).get(group_by, {}).items()
+        }
+
+    def select_entity_ids(
+        self,
+        user_id: str,
+        domains: list[str] | None = None,
+        area_ids: list[str] | None = None,
+    ) -> list[str]:
+        """Return a user's favorites in any of the domains and areas, in their order.
+
+        Uses the group index; a filter that is left out matches everything.
+        Items from the user's shared lists are included.
+        """
+        if self.shared.lists_for(user_id):
+            return [
+                item["entity_id"]
+                for item in self.get_user_view(user_id)
+                if (not domains or item["entity_id"].split(".", 1)[0] in domains)
+                and (not area_ids or item.get("area_id") in area_ids)
+            ]
+
+        index = self._items_by_user.get(user_id, {})
+        groups = self._groups.get(user_id, {})
+        selected: set[str] = set(index)
+        for group_by, keys in ((GROUP_BY_DOMAIN, domains), (GROUP_BY_AREA, area_ids)):
+            if keys:
+                members = groups.get(group_by, {})
+                selected &= set().union(*(members.get(key, ()) for key in keys))
+        return sorted(selected, key=lambda entity_id: index[entity_id].get("order", 0))
+
+    @property
+    def user_counts(self) -> Mapping[str, int]:
+        """Return the number of favorites per user (read-only view)."""
+        return self._user_counts
+
+    @property
+    def domain_counts(self) -> Mapping[str, int]:
+        """Return the number of favorites per entity domain (read-only view)."""
+        return self._domain_counts
+
+    @property
+    def area_counts(self) -> Mapping[str, int]:
+        """Return the number of favorites per area (read-only view)."""
+        return self._area_counts
+
     async def async_save(self) -> None:
-        """Save data from storage."""
-        await self._store.async_save(self._data)
+        """Save data to storage immediately."""
+        self._dirty = False
+        self.pending_saves = 0
+        self.flush_count += 1
+        with self.metrics.measure("save"):
+            if not self.sharded:
+                self.metrics.record_size("save", self._data)
+                await self._store.async_save(self._data)
+                return
+
+            dirty_users, self._dirty_users = self._dirty_users, set()
+            for user_id in dirty_users:
+                shard_data = self._shard_data(user_id)
+                self.metrics.record_size("save.shard", shard_data)
+                await self._shard(user_id).async_save(shard_data)
+            manifest = self._manifest_data()
+            self.metrics.record_size("save", manifest)
+            await self._store.async_save(manifest)
+
+    async def async_schedule_save(self, user_id: str | None = None) -> None:
+        """Save data, coalescing bursts of mutations into one write.
+
+        With a save delay the write is handed to the underlying Store, which
+        pushes it back on every call and also writes it on final shutdown.
+        In the sharded layout only the given user's shard and the manifest
+        are written. The user's revision is bumped first, so it is part of
+        the same write.
+        """
+        if user_id is not None:
+            self.next_revision(user_id)
+            if self.sharded:
+                self._dirty_users.add(user_id)
+        if self.save_delay <= 0:
+            await self.async_save()
+            return
+        self._dirty = True
+        self.pending_saves += 1
+        if not self.sharded:
+            self._store.async_delay_save(self._data_to_save, self.save_delay)
+            return
+
+        if user_id is not None:
+            self._shard(user_id).async_delay_save(
+                lambda: self._shard_data_to_save(user_id), self.save_delay
+            )
+        self._store.async_delay_save(self._data_to_save, self.save_delay)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now, if there are any."""
+        if self._dirty:
+            await self.async_save()
+        await self.usage.async_flush()
+        await self.shared.async_flush()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data for a delayed write.
+
+        The Store writes it to disk afterwards in the executor, so the
+        "save.delayed" timing covers building and serializing it only.
+        """
+        with self.metrics.measure("save.delayed"):
+            self._dirty = False
+            self.pending_saves = 0
+            self.flush_count += 1
+            data = self._manifest_data() if self.sharded else self._data
+            self.metrics.record_size("save.delayed", data)
+        return data
+
+    @callback
+    def _shard_data_to_save(self, user_id: str) -> dict[str, Any]:
+        """Return a user's shard for a delayed write."""
+        with self.metrics.measure("save.delayed"):
+            self._dirty_users.discard(user_id)
+            data = self._shard_data(user_id)
+            self.metrics.record_size("save.shard", data)
+        return data
+
+    def get_revision(self, user_id: str) -> int:
+        """Return the revision of a user's favorites."""
+        return self._data.get("revisions", {}).get(user_id, 0)
+
+    def next_revision(self, user_id: str) -> int:
+        """Bump and return the revision of a user's favorites.
+
+        Revisions are stored with the data and only ever increase, so event
+        consumers can detect a missed change and resync.
+        """
+        revisions = self._data.setdefault("revisions", {})
+        revisions[user_id] = revisions.get(user_id, 0) + 1
+        return revisions[user_id]
+
+    def announce_revision(self, user_id: str) -> int:
+        """Return the revision to send with a user's next change event.
+
+        Saving a change bumps the revision, so the stored revision is never
+        behind the announced one; each event takes the next bumped revision
+        in turn. An event without a saved change bumps it here.
+        """
+        announced = self._announced.get(user_id, 0)
+        if announced < self.get_revision(user_id):
+            announced += 1
+        else:
+            announced = self.next_revision(user_id)
+        self._announced[user_id] = announced
+        return announced
 
     @property
     def users(self) -> dict[str, list[dict[str, Any]]]:
-        """Return the full users dict (copy to avoid reference issues)."""
+        """Return the full users dict (copy to avoid reference issues).
+
+        In the sharded layout this only contains users that have been loaded.
+        """
         return dict(self._data.get("users", {}))
 
     def get_user_items(self, user_id: str) -> list[dict[str, Any]]:
@@ -89,107 +770,460 @@ class FavoritesStore:
         """Return list of favorited entity IDs for a specific user."""
         return [item["entity_id"] for item in self.get_user_items(user_id)]
 
+    def get_user_view(self, user_id: str) -> list[dict[str, Any]]:
+        """Return a user's own favorites merged with their shared lists, in order.
+
+        Shared items are copies carrying their list_id; without subscriptions
+        this is the user's own list.
+        """
+        return self.shared.view(user_id, self.get_user_items(user_id))
+
+    def get_view_entity_ids(self, user_id: str) -> list[str]:
+        """Return the entity IDs of a user's merged view."""
+        return [item["entity_id"] for item in self.get_user_view(user_id)]
+
+    def get_view_item(self, user_id: str, entity_id: str) -> dict[str, Any] | None:
+        """Return a user's own item for an entity, or their copy of a shared one."""
+        if (item := self.get_item(user_id, entity_id)) is not None:
+            return item
+        return self.shared.view_item(user_id, entity_id)
+
+    def get_user_items_by_usage(self, user_id: str) -> list[dict[str, Any]]:
+        """Return a user's favorites, shared ones included, most used first.
+
+        The ranked top comes from the usage tracker's top-K list; favorites
+        outside it follow in their manual order.
+        """
+        items = self.get_user_view(user_id)
+        index = {item["entity_id"]: item for item in items}
+        ranked = [index[entity_id] for entity_id in self.usage.top(user_id) if entity_id in index]
+        ranked_ids = {item["entity_id"] for item in ranked}
+        return ranked + [item for item in items if item["entity_id"] not in ranked_ids]
+
     def is_favorite(self, user_id: str, entity_id: str) -> bool:
         """Check if an entity is favorited by a specific user."""
-        return any(item["entity_id"] == entity_id for item in self.get_user_items(user_id))
+        return entity_id in self._items_by_user.get(user_id, {})
 
     def get_item(self, user_id: str, entity_id: str) -> dict[str, Any] | None:
         """Get a favorite item by entity_id for a specific user."""
-        for item in self.get_user_items(user_id):
-            if item["entity_id"] == entity_id:
-                return item
+        return self._items_by_user.get(user_id, {}).get(entity_id)
+
+    def get_entity_users(self, entity_id: str) -> set[str]:
+        """Return the IDs of the users that have favorited an entity."""
+        return set(self._users_by_entity.get(entity_id, ()))
+
+    def _entity_registry(self) -> er.EntityRegistry | None:
+        try:
+            return er.async_get(self.hass)
+        except Exception:
+            return None
+
+    def _area_id(
+        self, entity_id: str, entity_registry: er.EntityRegistry | None
+    ) -> str | None:
+        """Return the entity's area, falling back to the area of its device."""
+        if entity_registry is None or (entry := entity_registry.async_get(entity_id)) is None:
+            return None
+        if entry.area_id or not entry.device_id:
+            return entry.area_id
+        if device := dr.async_get(self.hass).async_get(entry.device_id):
+            return device.area_id
         return None
 
-    async def async_add(
+    def _new_item(
+        self,
+        entity_id: str,
+        order: int,
+        custom_name: str | None,
+        custom_icon: str | None,
+        entity_registry: er.EntityRegistry | None,
+    ) -> dict[str, Any]:
+        """Build a new favorite item, recording the entity's current area."""
+        item = {
+            "entity_id": entity_id,
+            "added_at": datetime.now().isoformat(),
+            "order": order,
+        }
+        _set_field(item, ATTR_CUSTOM_NAME, custom_name)
+        _set_field(item, ATTR_CUSTOM_ICON, custom_icon)
+        _set_field(item, "area_id", self._area_id(entity_id, entity_registry))
+        return item
+
+    def _prune_entity(self, user_id: str, entity_id: str) -> bool:
+        if not self.is_favorite(user_id, entity_id):
+            return False
+        # The remaining keys still increase, so nothing is renumbered
+        new_items = [
+            item for item in self.get_user_items(user_id) if item["entity_id"] != entity_id
+        ]
+        self._data["users"] = {**self._data.get("users", {}), user_id: new_items}
+        self._unindex_item(user_id, entity_id)
+        return True
+
+    def _rename_entity(self, user_id: str, old_entity_id: str, new_entity_id: str) -> bool:
+        if (item := self.get_item(user_id, old_entity_id)) is None:
+            return False
+        if self.is_favorite(user_id, new_entity_id):
+            return self._prune_entity(user_id, old_entity_id)
+        self.usage.rename(user_id, old_entity_id, new_entity_id)
+        self._unindex_item(user_id, old_entity_id)
+        item["entity_id"] = new_entity_id
+        self._index_item(user_id, item)
+        return True
+
+    def _refresh_area(
+        self, user_id: str, entity_id: str, entity_registry: er.EntityRegistry | None
+    ) -> bool:
+        if (item := self.get_item(user_id, entity_id)) is None:
+            return False
+        if (area_id := self._area_id(entity_id, entity_registry)) == item.get("area_id"):
+            return False
+        self._count_item(user_id, item, -1)
+        _set_field(item, "area_id", area_id)
+        self._count_item(user_id, item, 1)
+        return True
+
+    def _journal(self, change: str, *entity_ids: str) -> bool:
+        """Record a registry change for the unloaded shards that have the entity.
+
+        A change repeating the latest entry about the same entities is merged
+        into it. Returns whether the journal changed.
+        """
+        users = self._unloaded_by_entity.get(entity_ids[0], set()) | self._unloaded_unindexed
+        if not users:
+            return False
+        self._track_journaled(change, list(entity_ids), users)
+        for entry in reversed(self._registry_journal):
+            if not set(entry["entity_ids"]).intersection(entity_ids):
+                continue
+            if entry["change"] == change and entry["entity_ids"] == list(entity_ids):
+                if users.issubset(entry["users"]):
+                    return False
+                entry["users"] = sorted(users.union(entry["users"]))
+                return True
+            break
+        self._registry_journal.append(
+            {"change": change, "entity_ids": list(entity_ids), "users": sorted(users)}
+        )
+        return True
+
+    def _track_journaled(self, change: str, entity_ids: list[str], users: set[str]) -> None:
+        """Apply a journaled removal or rename to the unloaded users' entity index."""
+        if change == "area" or (holders := self._unloaded_by_entity.get(entity_ids[0])) is None:
+            return
+        moved = holders & users
+        holders -= moved
+        if not holders:
+            del self._unloaded_by_entity[entity_ids[0]]
+        if change == "rename" and moved:
+            self._unloaded_by_entity.setdefault(entity_ids[1], set()).update(moved)
+
+    def _replay_registry_journal(self, user_id: str) -> list[str]:
+        """Apply the registry changes recorded while a user's shard was unloaded.
+
+        Returns the entity IDs that changed. Entries that no unloaded shard
+        needs anymore are dropped.
+        """
+        entity_registry = self._entity_registry()
+        changed: list[str] = []
+        for entry in self._registry_journal:
+            if user_id not in entry["users"]:
+                continue
+            entry["users"].remove(user_id)
+            change, entity_ids = entry["change"], entry["entity_ids"]
+            if change == "remove":
+                applied = self._prune_entity(user_id, entity_ids[0])
+            elif change == "rename":
+                applied = self._rename_entity(user_id, entity_ids[0], entity_ids[1])
+            else:
+                applied = self._refresh_area(user_id, entity_ids[0], entity_registry)
+            if applied:
+                changed.extend(entity_id for entity_id in entity_ids if entity_id not in changed)
+        self._registry_journal = [entry for entry in self._registry_journal if entry["users"]]
+        return changed
+
+    async def async_registry_removed(self, entity_id: str) -> set[str]:
+        """Drop a deleted entity from every user that favorited it.
+
+        Returns the IDs of the users whose favorites changed.
+        """
+        await self.async_wait_loaded()
+        journaled = self._journal("remove", entity_id)
+        user_ids = {
+            user_id for user_id in self.get_entity_users(entity_id)
+            if self._prune_entity(user_id, entity_id)
+        }
+        for user_id in user_ids:
+            await self.async_schedule_save(user_id)
+        if journaled and not user_ids:
+            await self.async_schedule_save()
+        return user_ids
+
+    async def async_registry_renamed(
+        self, old_entity_id: str, new_entity_id: str
+    ) -> set[str]:
+        """Point favorites of a renamed entity at its new entity_id."""
+        await self.async_wait_loaded()
+        journaled = self._journal("rename", old_entity_id, new_entity_id)
+        user_ids = {
+            user_id for user_id in self.get_entity_users(old_entity_id)
+            if self._rename_entity(user_id, old_entity_id, new_entity_id)
+        }
+        for user_id in user_ids:
+            await self.async_schedule_save(user_id)
+        if journaled and not user_ids:
+            await self.async_schedule_save()
+        return user_ids
+
+    async def async_refresh_areas(self, entity_ids: list[str]) -> dict[str, list[str]]:
+        """Re-resolve the area of the given entities for every user that has them.
+
+        Returns the changed entity IDs per user.
+        """
+        await self.async_wait_loaded()
+        entity_registry = self._entity_registry()
+        changed: dict[str, list[str]] = {}
+        journaled = False
+        for entity_id in entity_ids:
+            journaled |= self._journal("area", entity_id)
+            for user_id in self.get_entity_users(entity_id):
+                if self._refresh_area(user_id, entity_id, entity_registry):
+                    changed.setdefault(user_id, []).append(entity_id)
+        for user_id in changed:
+            await self.async_schedule_save(user_id)
+        if journaled and not changed:
+            await self.async_schedule_save()
+        return changed
+
+    def _user_lock(self, user_id: str) -> asyncio.Lock:
+        """Return the lock that serializes mutations of a user's favorites."""
+        if (lock := self._locks.get(user_id)) is None:
+            lock = self._locks[user_id] = asyncio.Lock()
+        return lock
+
+    def _insert_item(
         self,
         user_id: str,
         entity_id: str,
         custom_name: str | None = None,
         custom_icon: str | None = None,
     ) -> bool:
-        """Add an entity to favorites for a specific user."""
         if self.is_favorite(user_id, entity_id):
             return False
 
-        if user_id not in self._data["users"]:
-            self._data["users"][user_id] = []
-
-        area_id = None
-        try:
-            entity_registry = er.async_get(self.hass)
-            if entry := entity_registry.async_get(entity_id):
-                area_id = entry.area_id
-        except Exception:
-            pass
-
         user_items = self.get_user_items(user_id)
-        new_item = {
-            "entity_id": entity_id,
-            "added_at": datetime.now().isoformat(),
-            "order": len(user_items),
-            "custom_name": custom_name,
-            "custom_icon": custom_icon,
-            "area_id": area_id,
-        }
+        new_item = self._new_item(
+            entity_id,
+            self._next_own_order(user_id, user_items),
+            custom_name,
+            custom_icon,
+            self._entity_registry(),
+        )
 
         new_user_items = [*user_items, new_item]
         self._data["users"] = {**self._data.get("users", {}), user_id: new_user_items}
-        await self.async_save()
+        self._index_item(user_id, new_item)
         return True
 
-    async def async_remove(self, user_id: str, entity_id: str) -> bool:
-        """Remove an entity from favorites for a specific user."""
-        if user_id not in self._data["users"]:
+    def _next_own_order(self, user_id: str, items: list[dict[str, Any]]) -> int:
+        """Return the order key for a new own item, after the shared items the user placed."""
+        return max(_next_order(items), self.shared.placed_order(user_id) + ORDER_STEP)
+
+    def _is_view_placed(self, user_id: str, view: list[dict[str, Any]]) -> bool:
+        """Return whether every item of a view has an order key of the user's own."""
+        return all(
+            "list_id" not in item or self.shared.is_placed(user_id, item["entity_id"])
+            for item in view
+        )
+
+    def _is_shared_only(self, user_id: str, entity_id: str) -> bool:
+        """Return whether an entity is in the user's shared lists but not their own."""
+        return (
+            not self.is_favorite(user_id, entity_id)
+            and self.shared.view_item(user_id, entity_id, include_hidden=True) is not None
+        )
+
+    def _set_hidden(self, user_id: str, entity_id: str, hidden: bool) -> bool:
+        """Hide or unhide a shared favorite in the user's overlay."""
+        if bool(self.shared.get_overlay(user_id, entity_id).get("hidden")) == hidden:
             return False
+        self.shared.set_overlay(user_id, entity_id, hidden=hidden or None)
+        return True
 
-        user_items = self.get_user_items(user_id)
-        original_length = len(user_items)
-        new_items = [item for item in user_items if item["entity_id"] != entity_id]
+    def _apply_shared_op(
+        self, user_id: str, op: str, entity_id: str, fields: Mapping[str, Any]
+    ) -> tuple[str, bool] | None:
+        """Apply an operation to a favorite the user only has from a shared list.
 
-        if len(new_items) < original_length:
-            for i, item in enumerate(new_items):
-                item["order"] = i
-            self._data["users"] = {**self._data.get("users", {}), user_id: new_items}
-            await self.async_save()
+        Adding and removing unhide and hide it, and updates go to the user's
+        overlay. Returns the resolved op and whether anything changed, or
+        None when the user's own list applies instead.
+        """
+        if not self._is_shared_only(user_id, entity_id):
+            return None
+        if op == "toggle":
+            op = "add" if self.shared.get_overlay(user_id, entity_id).get("hidden") else "remove"
+        if op in ("add", "remove"):
+            return op, self._set_hidden(user_id, entity_id, op == "remove")
+        overlay = self.shared.get_overlay(user_id, entity_id)
+        changes = {
+            key: fields[key]
+            for key in (ATTR_CUSTOM_NAME, ATTR_CUSTOM_ICON)
+            if key in fields and overlay.get(key) != fields[key]
+        }
+        self.shared.set_overlay(user_id, entity_id, **changes)
+        return op, bool(changes)
+
+    async def _async_save_overlays(self, user_id: str) -> None:
+        """Save the shared lists' overlays, and the user's bumped revision."""
+        await self.shared.async_schedule_save(self.save_delay)
+        await self.async_schedule_save(user_id)
+
+    async def _async_apply_view_orders(
+        self, user_id: str, view: list[dict[str, Any]]
+    ) -> bool:
+        """Store the order keys of a rearranged view; returns whether any changed.
+
+        Own items take their new keys; shared items get theirs in the user's
+        overlay, so the shared list itself is left alone.
+        """
+        own = self._items_by_user.get(user_id, {})
+        own_changed = overlays_changed = False
+        for item in view:
+            entity_id = item["entity_id"]
+            if "list_id" not in item:
+                if own[entity_id]["order"] != item["order"]:
+                    own[entity_id]["order"] = item["order"]
+                    own_changed = True
+            elif self.shared.get_overlay(user_id, entity_id).get("order") != item["order"]:
+                self.shared.set_overlay(user_id, entity_id, order=item["order"])
+                overlays_changed = True
+
+        if own_changed:
+            items = sorted(self.get_user_items(user_id), key=lambda item: item["order"])
+            self._data["users"] = {**self._data.get("users", {}), user_id: items}
+        if overlays_changed:
+            await self.shared.async_schedule_save(self.save_delay)
+        if own_changed or overlays_changed:
+            await self.async_schedule_save(user_id)
+        return own_changed or overlays_changed
+
+    async def async_add(
+        self,
+        user_id: str,
+        entity_id: str,
+        custom_name: str | None = None,
+        custom_icon: str | None = None,
+    ) -> bool:
+        """Add an entity to favorites for a specific user.
+
+        Adding a favorite from one of the user's shared lists only unhides it.
+        """
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            if (shared := self._apply_shared_op(user_id, "add", entity_id, {})) is not None:
+                if shared[1]:
+                    await self._async_save_overlays(user_id)
+                return shared[1]
+
+            if not self._insert_item(user_id, entity_id, custom_name, custom_icon):
+                return False
+
+            await self.async_schedule_save(user_id)
+            return True
+
+    async def async_remove(self, user_id: str, entity_id: str) -> bool:
+        """Remove an entity from favorites for a specific user.
+
+        Favorites from one of the user's shared lists are hidden for them instead.
+        """
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            if (shared := self._apply_shared_op(user_id, "remove", entity_id, {})) is not None:
+                if shared[1]:
+                    await self._async_save_overlays(user_id)
+                return shared[1]
+
+            if not self._prune_entity(user_id, entity_id):
+                return False
+
+            await self.async_schedule_save(user_id)
             return True
-        return False
 
     async def async_toggle(self, user_id: str, entity_id: str) -> bool:
         """Toggle favorite status for a specific user."""
-        if self.is_favorite(user_id, entity_id):
-            await self.async_remove(user_id, entity_id)
-            return False
-        else:
-            await self.async_add(user_id, entity_id)
-            return True
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            if (shared := self._apply_shared_op(user_id, "toggle", entity_id, {})) is not None:
+                await self._async_save_overlays(user_id)
+                return shared[0] == "add"
 
-    async def async_reorder(self, user_id: str, entity_ids: list[str]) -> None:
-        """Reorder favorites based on provided entity_id list for a specific user."""
-        if user_id not in self._data["users"]:
-            return # FIXED: removed typo 'return return'
+            if self._prune_entity(user_id, entity_id):
+                is_favorite = False
+            else:
+                is_favorite = self._insert_item(user_id, entity_id)
 
-        user_items = self.get_user_items(user_id)
-        item_map = {item["entity_id"]: item for item in user_items}
-        new_items = []
+            await self.async_schedule_save(user_id)
+            return is_favorite
 
-        for i, entity_id in enumerate(entity_ids):
-            if entity_id in item_map:
-                item = item_map[entity_id]
-                item["order"] = i
-                new_items.append(item)
+    async def async_reorder(self, user_id: str, entity_ids: list[str]) -> bool:
+        """Reorder favorites based on provided entity_id list for a specific user.
 
-        for item in user_items:
-            if item["entity_id"] not in entity_ids:
-                item["order"] = len(new_items)
-                new_items.append(item)
+        Reorders still waiting for the user's lock are superseded by newer
+        ones: only the latest is applied and the others return False.
+        """
+        self._pending_reorders[user_id] = entity_ids
+        async with self._user_lock(user_id):
+            if self._pending_reorders.get(user_id) is not entity_ids:
+                return False
+            del self._pending_reorders[user_id]
 
-        self._data["users"] = {**self._data.get("users", {}), user_id: new_items}
-        await self.async_save()
+            await self.async_ensure_loaded(user_id)
+            if self.shared.lists_for(user_id):
+                # Shared items are ordered through the user's overlay
+                view = [dict(item) for item in self.get_user_view(user_id)]
+                ranks = {entity_id: i for i, entity_id in enumerate(dict.fromkeys(entity_ids))}
+                view.sort(key=lambda item: ranks.get(item["entity_id"], len(ranks)))
+                # Shared items the user never placed have keys from their
+                # list, so the whole view gets keys of the user's own
+                if self._is_view_placed(user_id, view):
+                    _reassign_orders(view)
+                else:
+                    _renumber(view)
+                return await self._async_apply_view_orders(user_id, view)
+
+            if user_id not in self._data["users"]:
+                return False
+
+            user_items = self.get_user_items(user_id)
+            item_map = self._items_by_user.get(user_id, {})
+            new_items = []
+            placed: set[str] = set()
+
+            for entity_id in entity_ids:
+                if entity_id in item_map and entity_id not in placed:
+                    new_items.append(item_map[entity_id])
+                    placed.add(entity_id)
+
+            for item in user_items:
+                if item["entity_id"] not in placed:
+                    new_items.append(item)
+
+            # Only the items that actually moved get new order keys
+            _reassign_orders(new_items)
+            self._data["users"] = {**self._data.get("users", {}), user_id: new_items}
+            await self.async_schedule_save(user_id)
+            return True
 
     async def async_clear(self, user_id: str) -> None:
         """Clear all favorites for a specific user."""
-        self._data["users"] = {**self._data.get("users", {}), user_id: []}
-        await self.async_save()
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            for entity_id in list(self._items_by_user.get(user_id, {})):
+                self._unindex_item(user_id, entity_id)
+            self._data["users"] = {**self._data.get("users", {}), user_id: []}
+            self._user_counts.setdefault(user_id, 0)
+            await self.async_schedule_save(user_id)
 
     async def async_update(
         self,
@@ -197,24 +1231,286 @@ class FavoritesStore:
         entity_id: str,
         custom_name: str | None = None,
     ) -> bool:
-        """Update a favorite's custom name for a specific user."""
-        if user_id not in self._data["users"]:
-            return False
+        """Update a favorite's custom name for a specific user.
 
-        user_items = self.get_user_items(user_id)
-        updated = False
-        
-        for item in user_items:
-            if item["entity_id"] == entity_id:
-                item["custom_name"] = custom_name
-                updated = True
-                break
-        
-        if updated:
-            self._data["users"] = {**self._data.get("users", {}), user_id: user_items}
-            await self.async_save()
-        
-        return updated
+        The name of a shared favorite is kept in the user's overlay.
+        """
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            fields = {ATTR_CUSTOM_NAME: custom_name}
+            if (shared := self._apply_shared_op(user_id, "update", entity_id, fields)) is not None:
+                if shared[1]:
+                    await self._async_save_overlays(user_id)
+                return shared[1]
+
+            if (item := self.get_item(user_id, entity_id)) is None:
+                return False
+
+            _set_field(item, ATTR_CUSTOM_NAME, custom_name)
+            await self.async_schedule_save(user_id)
+            return True
+
+    async def async_move(self, user_id: str, entity_id: str, position: int) -> bool:
+        """Move one favorite to a new position in the user's list.
+
+        Only the moved item gets a new order key, between its new
+        neighbours'; the whole list is only renumbered once a gap runs out.
+        With shared lists, the position is in the user's merged view.
+        """
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            if self.shared.lists_for(user_id):
+                view = [dict(item) for item in self.get_user_view(user_id)]
+                entity_ids = [item["entity_id"] for item in view]
+                if entity_id not in entity_ids:
+                    return False
+                old_index = entity_ids.index(entity_id)
+                position = max(0, min(position, len(view) - 1))
+                if position == old_index:
+                    return False
+                view.insert(position, view.pop(old_index))
+                if not self._is_view_placed(user_id, view) or not _fit_order(view, position):
+                    _renumber(view)
+                return await self._async_apply_view_orders(user_id, view)
+
+            if (item := self.get_item(user_id, entity_id)) is None:
+                return False
+
+            items = list(self.get_user_items(user_id))
+            old_index = next(i for i, other in enumerate(items) if other is item)
+            position = max(0, min(position, len(items) - 1))
+            if position == old_index:
+                return False
+
+            items.insert(position, items.pop(old_index))
+            if not _fit_order(items, position):
+                _renumber(items)
+            self._data["users"] = {**self._data.get("users", {}), user_id: items}
+            await self.async_schedule_save(user_id)
+            return True
+
+    async def async_import_batch(
+        self, batch: dict[str, list[dict[str, Any]]]
+    ) -> dict[str, list[str]]:
+        """Add imported favorites of several users, committed with one save.
+
+        Favorites a user already has are left untouched. Returns the added
+        entity IDs per user.
+        """
+        added: dict[str, list[str]] = {}
+        async with AsyncExitStack() as stack:
+            # Sorted, so two batches never wait on each other's locks
+            for user_id in sorted(batch):
+                await stack.enter_async_context(self._user_lock(user_id))
+                await self.async_ensure_loaded(user_id)
+
+            entity_registry = self._entity_registry()
+            for user_id, records in batch.items():
+                items = list(self.get_user_items(user_id))
+                for record in records:
+                    entity_id = record[ATTR_ENTITY_ID]
+                    if self.is_favorite(user_id, entity_id):
+                        continue
+                    item = self._new_item(
+                        entity_id,
+                        self._next_own_order(user_id, items),
+                        record.get(ATTR_CUSTOM_NAME),
+                        record.get(ATTR_CUSTOM_ICON),
+                        entity_registry,
+                    )
+                    if record.get("added_at"):
+                        item["added_at"] = record["added_at"]
+                    items.append(item)
+                    self._index_item(user_id, item)
+                    added.setdefault(user_id, []).append(entity_id)
+                if user_id in added:
+                    self._data["users"] = {**self._data.get("users", {}), user_id: items}
+
+            if added:
+                for user_id in added:
+                    self.next_revision(user_id)
+                if self.sharded:
+                    self._dirty_users.update(added)
+                await self.async_save()
+        return added
+
+    async def async_apply(
+        self, user_id: str, operations: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Apply a list of add/remove/toggle/update operations in one pass.
+
+        The user's list is rebuilt and saved once at the end, regardless of
+        how many operations were applied. Favorites the user only has from a
+        shared list are handled through their overlay, as with the single
+        operations. Returns one result per operation.
+        """
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            entity_registry = self._entity_registry()
+            items = list(self.get_user_items(user_id))
+            results: list[dict[str, Any]] = []
+            overlays_changed = False
+
+            for operation in operations:
+                op = operation[ATTR_OP]
+                entity_id = operation[ATTR_ENTITY_ID]
+                if (shared := self._apply_shared_op(user_id, op, entity_id, operation)) is not None:
+                    op, changed = shared
+                    overlays_changed |= changed
+                    results.append({ATTR_ENTITY_ID: entity_id, ATTR_OP: op, "changed": changed})
+                    continue
+                if op == "toggle":
+                    op = "remove" if self.is_favorite(user_id, entity_id) else "add"
+
+                changed = False
+                if op == "add":
+                    if not self.is_favorite(user_id, entity_id):
+                        item = self._new_item(
+                            entity_id,
+                            self._next_own_order(user_id, items),
+                            operation.get(ATTR_CUSTOM_NAME),
+                            operation.get(ATTR_CUSTOM_ICON),
+                            entity_registry,
+                        )
+                        items.append(item)
+                        self._index_item(user_id, item)
+                        changed = True
+                elif op == "remove":
+                    if self.is_favorite(user_id, entity_id):
+                        self._unindex_item(user_id, entity_id)
+                        changed = True
+                elif op == "update":
+                    if (item := self.get_item(user_id, entity_id)) is not None:
+                        for key in (ATTR_CUSTOM_NAME, ATTR_CUSTOM_ICON):
+                            if key in operation and item.get(key) != operation[key]:
+                                _set_field(item, key, operation[key])
+                                changed = True
+
+                results.append({ATTR_ENTITY_ID: entity_id, ATTR_OP: op, "changed": changed})
+
+            if not any(result["changed"] for result in results):
+                return results
+
+            # Items removed in this batch are no longer the indexed item for their entity
+            index = self._items_by_user.get(user_id, {})
+            new_items = [item for item in items if index.get(item["entity_id"]) is item]
+            self._data["users"] = {**self._data.get("users", {}), user_id: new_items}
+            if overlays_changed:
+                await self.shared.async_schedule_save(self.save_delay)
+            await self.async_schedule_save(user_id)
+            return results
+
+    def _list_lock(self, list_id: str) -> asyncio.Lock:
+        """Return the lock that serializes changes to a shared list."""
+        # Shared lists share the lock table with users, under their own prefix
+        return self._user_lock(f"shared.{list_id}")
+
+    async def async_shared_add(
+        self, list_id: str, entity_ids: list[str], name: str | None = None
+    ) -> list[str]:
+        """Add entities to a shared list, creating the list if it does not exist.
+
+        Returns the entity IDs that were added.
+        """
+        async with self._list_lock(list_id):
+            await self.async_wait_loaded()
+            created = list_id not in self.shared.lists
+            items = list(self.shared.get_items(list_id))
+            entity_registry = self._entity_registry()
+            added: list[str] = []
+            for entity_id in dict.fromkeys(entity_ids):
+                if self.shared.get_item(list_id, entity_id) is None:
+                    items.append(
+                        self._new_item(entity_id, _next_order(items), None, None, entity_registry)
+                    )
+                    added.append(entity_id)
+            if added or created or name:
+                self.shared.set_items(list_id, items, name)
+                await self.shared.async_schedule_save(self.save_delay)
+            return added
+
+    async def async_shared_remove(self, list_id: str, entity_ids: list[str]) -> list[str]:
+        """Remove entities from a shared list; returns the entity IDs removed."""
+        async with self._list_lock(list_id):
+            await self.async_wait_loaded()
+            removed = [
+                entity_id for entity_id in dict.fromkeys(entity_ids)
+                if self.shared.get_item(list_id, entity_id) is not None
+            ]
+            if not removed:
+                return []
+            self._drop_shared_items(list_id, set(removed))
+            await self.shared.async_schedule_save(self.save_delay)
+            return removed
+
+    def _drop_shared_items(self, list_id: str, entity_ids: set[str]) -> None:
+        items = [
+            item for item in self.shared.get_items(list_id) if item["entity_id"] not in entity_ids
+        ]
+        self.shared.set_items(list_id, items)
+        for user_id in self.shared.subscribers(list_id):
+            self.shared.prune_overlays(user_id)
+
+    async def async_shared_delete(self, list_id: str) -> list[str]:
+        """Delete a shared list; returns the users that were subscribed to it."""
+        async with self._list_lock(list_id):
+            await self.async_wait_loaded()
+            if list_id not in self.shared.lists:
+                return []
+            user_ids = self.shared.delete(list_id)
+            await self.shared.async_schedule_save(self.save_delay)
+            return user_ids
+
+    async def async_subscribe(self, user_id: str, list_id: str) -> bool:
+        """Subscribe a user to a shared list."""
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            if not self.shared.subscribe(user_id, list_id):
+                return False
+            await self._async_save_overlays(user_id)
+            return True
+
+    async def async_unsubscribe(self, user_id: str, list_id: str) -> bool:
+        """Unsubscribe a user from a shared list, dropping their overlays for it."""
+        async with self._user_lock(user_id):
+            await self.async_ensure_loaded(user_id)
+            if not self.shared.unsubscribe(user_id, list_id):
+                return False
+            await self._async_save_overlays(user_id)
+            return True
+
+    async def async_shared_registry_changed(self, change: str, *entity_ids: str) -> list[str]:
+        """Apply an entity registry change to the shared lists.
+
+        change is "remove", "rename" (old and new entity_id) or "area", as
+        in the registry journal. Returns the IDs of the lists that changed.
+        """
+        await self.async_wait_loaded()
+        list_ids = self.shared.lists_with(entity_ids[0])
+        if change == "remove":
+            for list_id in list_ids:
+                self._drop_shared_items(list_id, {entity_ids[0]})
+        elif change == "rename":
+            old_entity_id, new_entity_id = entity_ids
+            for list_id in list_ids:
+                if self.shared.get_item(list_id, new_entity_id) is not None:
+                    self._drop_shared_items(list_id, {old_entity_id})
+                    continue
+                self.shared.get_item(list_id, old_entity_id)["entity_id"] = new_entity_id
+                self.shared.set_items(list_id, self.shared.get_items(list_id))
+            self.shared.rename_overlays(old_entity_id, new_entity_id)
+        elif change == "area":
+            entity_registry = self._entity_registry()
+            area_id = self._area_id(entity_ids[0], entity_registry)
+            list_ids = [
+                list_id for list_id in list_ids
+                if self.shared.get_item(list_id, entity_ids[0]).get("area_id") != area_id
+            ]
+            for list_id in list_ids:
+                _set_field(self.shared.get_item(list_id, entity_ids[0]), "area_id", area_id)
+        if list_ids:
+            await self.shared.async_schedule_save(self.save_delay)
+        return list_ids
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -222,88 +1518,130 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
-async def async_register_resources(hass: HomeAssistant) -> None:
-    """Automatically register Lovelace resources using static path."""
+async def async_register_lovelace_resources(
+    hass: HomeAssistant, hashes: dict[str, str]
+) -> None:
+    """Point the Lovelace resources at the cards' current hashed URLs.
+
+    Entries for a card are updated in place when its hash changed, and
+    duplicates of it are removed, so there is always exactly one per card.
+    """
+    if (lovelace := hass.data.get("lovelace")) is None:
+        _LOGGER.debug("Lovelace not loaded, skipping automatic resource registration")
+        return
+
+    # A dict before Home Assistant 2024.12, a dataclass since
+    if hasattr(lovelace, "resources"):
+        resources = lovelace.resources
+    else:
+        resources = lovelace.get("resources")
+    if resources is None or not hasattr(resources, "async_create_item"):
+        _LOGGER.debug("Lovelace resources are managed in YAML, skipping automatic registration")
+        return
+
+    if not getattr(resources, "loaded", True):
+        await resources.async_load()
+        resources.loaded = True
+
+    # One read of the collection for all cards
+    existing = list(resources.async_items())
+    for filename, file_hash in hashes.items():
+        base_url = f"{ASSET_URL_PATH}/{filename}"
+        url = f"{base_url}?v={file_hash}"
+        matches = [
+            res for res in existing if str(res.get("url", "")).split("?", 1)[0] == base_url
+        ]
+        if not matches:
+            await resources.async_create_item({"res_type": "module", "url": url})
+            _LOGGER.info("Automatically registered resource: %s", url)
+            continue
+
+        # Keep an entry that is already current, if there is one
+        matches.sort(key=lambda res: res.get("url") != url)
+        current, *duplicates = matches
+        if current.get("url") != url or current.get("type") != "module":
+            await resources.async_update_item(current["id"], {"res_type": "module", "url": url})
+            _LOGGER.info("Updated resource %s to %s", current.get("url"), url)
+        else:
+            _LOGGER.debug("Resource already up to date: %s", url)
+        for duplicate in duplicates:
+            await resources.async_delete_item(duplicate["id"])
+            _LOGGER.info("Removed duplicate resource: %s", duplicate.get("url"))
+
+
+async def async_register_resources(hass: HomeAssistant) -> CALLBACK_TYPE | None:
+    """Serve the cards and register them as Lovelace resources.
+
+    The files are hashed and precompressed in the executor and the Lovelace
+    resources are only touched once Home Assistant has started, so neither
+    holds up startup. Returns a callback that cancels the pending
+    registration.
+    """
     try:
-        # 1. Find the path to the integration's www folder
-        integration = await async_get_integration(hass, DOMAIN)
-        integration_path = integration.file_path
-        www_path = os.path.join(integration_path, "www")
-        
-        if not os.path.isdir(www_path):
-            _LOGGER.warning("www directory not found, skipping resource registration")
-            return
-        
-        # 2. Register the static path so HA serves these files
-        hass.http.register_static_path(
-            ASSET_URL_PATH,
-            www_path,
-            cache_headers=True
-        )
-        
-        # 3. Register the resources in Lovelace
+        www_path = os.path.join(os.path.dirname(__file__), "www")
+        hashes = await hass.async_add_executor_job(prepare_card_files, www_path, CARD_FILES)
+        if not hashes:
+            _LOGGER.warning("Card files not found in %s, skipping resource registration", www_path)
+            return None
+
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        if (view := domain_data.get("asset_view")) is None:
+            # aiohttp refuses a second route for the same path, so on reload
+            # the registered view only gets the new hashes
+            view = domain_data["asset_view"] = CardAssetView(ASSET_URL_PATH, www_path, hashes)
+            hass.http.register_view(view)
+        else:
+            view.hashes = hashes
+    except Exception as err:
+        _LOGGER.error("Failed to register resources: %s", err)
+        return None
+
+    async def async_register_when_started(hass: HomeAssistant) -> None:
         try:
-            if "lovelace" not in hass.data:
-                _LOGGER.debug("Lovelace not loaded yet, resources will be registered on next restart")
-                return
-            
-            resources = hass.data["lovelace"]["resources"]
-            if not resources:
-                _LOGGER.warning("Lovelace resources collection not available")
-                return
-            
-            card_files = [
-                ("favoritable-card.js", "favoritable-card"),
-                ("favorites-grid-card.js", "favorites-grid-card"),
-            ]
-            
-            for filename, card_type in card_files:
-                file_path = os.path.join(www_path, filename)
-                if not os.path.isfile(file_path):
-                    _LOGGER.warning("Card file not found: %s", filename)
-                    continue
-                
-                # UPDATED: Use static URL
-                url = f"{ASSET_URL_PATH}/{filename}"
-                
-                existing_resources = await resources.async_items()
-                resource_exists = any(
-                    res.get("url") == url and res.get("type") == "module"
-                    for res in existing_resources
-                )
-                
-                if not resource_exists:
-                    await resources.async_create_item({
-                        "type": "module",
-                        "url": url,
-                    })
-                    _LOGGER.info("Automatically registered resource: %s", url)
-                else:
-                    _LOGGER.debug("Resource already exists: %s", url)
-                    
-        except ImportError:
-            _LOGGER.warning("Lovelace resources not available, skipping automatic registration")
+            await async_register_lovelace_resources(hass, hashes)
         except Exception as err:
             _LOGGER.error("Error registering resources: %s", err)
-            
-    except Exception as err:
-        _LOGGER.error("Failed to register resources: %s", err)
+
+    return async_at_started(hass, async_register_when_started)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Favorites from a config entry."""
-    store = FavoritesStore(hass)
-    await store.async_load()
+    store = FavoritesStore(
+        hass,
+        entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+        sharded=(
+            entry.options.get(CONF_STORAGE_LAYOUT, DEFAULT_STORAGE_LAYOUT)
+            == STORAGE_LAYOUT_SHARDED
+        ),
+    )
+    store.event_format = entry.options.get(CONF_EVENT_FORMAT, DEFAULT_EVENT_FORMAT)
+    store.metrics.enabled = entry.options.get(CONF_DEBUG_METRICS, DEFAULT_DEBUG_METRICS)
+    store.recorder_friendly = entry.options.get(CONF_RECORDER_FRIENDLY, DEFAULT_RECORDER_FRIENDLY)
+    # Services and entities are set up right away; everything that needs the
+    # favorites waits for this load
+    store.async_start_load()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = store
     hass.data[DOMAIN]["store"] = store
 
+    async def async_flush_on_stop(event: Event) -> None:
+        await store.async_flush()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_flush_on_stop)
+    )
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+
+    async_setup_registry_listeners(hass, entry, store)
+    async_setup_usage_tracking(hass, entry, store)
     await async_register_services(hass, store)
+    async_register_websocket_commands(hass)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
-    # Run resource registration
-    await async_register_resources(hass)
+
+    if cancel_registration := await async_register_resources(hass):
+        entry.async_on_unload(cancel_registration)
 
     return True
 
@@ -312,25 +1650,237 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        store: FavoritesStore = hass.data[DOMAIN].pop(entry.entry_id)
+        await store.async_wait_loaded()
+        await store.async_flush()
     return unload_ok
 
 
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running store."""
+    store: FavoritesStore = hass.data[DOMAIN][entry.entry_id]
+    layout = entry.options.get(CONF_STORAGE_LAYOUT, DEFAULT_STORAGE_LAYOUT)
+    debug_metrics = entry.options.get(CONF_DEBUG_METRICS, DEFAULT_DEBUG_METRICS)
+    recorder_friendly = entry.options.get(CONF_RECORDER_FRIENDLY, DEFAULT_RECORDER_FRIENDLY)
+    if (
+        store.sharded != (layout == STORAGE_LAYOUT_SHARDED)
+        or store.metrics.enabled != debug_metrics
+        or store.recorder_friendly != recorder_friendly
+    ):
+        # Switching layouts migrates the data on load; the debug sensor is
+        # only created during platform setup, and the sensors rewrite their
+        # attributes when they are added again
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    store.save_delay = entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+    store.event_format = entry.options.get(CONF_EVENT_FORMAT, DEFAULT_EVENT_FORMAT)
+
+
+@callback
+def async_fire_changed_event(
+    hass: HomeAssistant,
+    store: FavoritesStore,
+    action: str,
+    user_id: str,
+    entity_id: str | None = None,
+    entity_ids: list[str] | None = None,
+) -> None:
+    """Fire event when favorites change.
+
+    The delta format only carries the affected entities and their new
+    positions; the full format also carries the user's complete list.
+    Recorder-friendly mode always uses the delta format.
+    """
+    with store.metrics.measure("event"):
+        data: dict[str, Any] = {
+            "action": action,
+            "user_id": user_id,
+            "entity_id": entity_id,
+            "revision": store.announce_revision(user_id),
+        }
+
+        if store.event_format == EVENT_FORMAT_FULL and not store.recorder_friendly:
+            data["favorites"] = store.get_user_entity_ids(user_id)
+        else:
+            if entity_ids is None:
+                entity_ids = [entity_id] if entity_id else []
+            data["entity_ids"] = entity_ids
+            # Positions are list indexes; the stored order keys are sparse
+            wanted = set(entity_ids)
+            data["positions"] = {
+                item["entity_id"]: i
+                for i, item in enumerate(store.get_user_items(user_id))
+                if item["entity_id"] in wanted
+            }
+
+        hass.bus.async_fire(EVENT_FAVORITES_CHANGED, data)
+    store.metrics.record_size("event", data)
+
+
+@callback
+def async_fire_shared_event(
+    hass: HomeAssistant,
+    store: FavoritesStore,
+    action: str,
+    list_id: str,
+    entity_id: str | None = None,
+    entity_ids: list[str] | None = None,
+    user_ids: list[str] | None = None,
+) -> None:
+    """Fire one event for a change to a shared list.
+
+    The event carries list_id and the subscribers in user_ids instead of a
+    user_id, and listeners for a user only act on it when the user is one of
+    them. The full format carries the list's entity IDs once, not per user.
+    """
+    with store.metrics.measure("event"):
+        data: dict[str, Any] = {
+            "action": action,
+            "list_id": list_id,
+            "user_ids": store.shared.subscribers(list_id) if user_ids is None else user_ids,
+            "entity_id": entity_id,
+        }
+        if store.event_format == EVENT_FORMAT_FULL and not store.recorder_friendly:
+            data["favorites"] = [item["entity_id"] for item in store.shared.get_items(list_id)]
+        else:
+            if entity_ids is None:
+                entity_ids = [entity_id] if entity_id else []
+            data["entity_ids"] = entity_ids
+
+        hass.bus.async_fire(EVENT_FAVORITES_CHANGED, data)
+    store.metrics.record_size("event", data)
+
+
+@callback
+def async_setup_registry_listeners(
+    hass: HomeAssistant, entry: ConfigEntry, store: FavoritesStore
+) -> None:
+    """Keep favorites in sync with entity and device registry changes.
+
+    Only favorites of the affected entity are touched, found through the
+    store's entity -> users index; each affected user gets one save and
+    one change event per registry change.
+    """
+
+    async def async_entity_registry_updated(event: Event) -> None:
+        action = event.data["action"]
+        entity_id = event.data["entity_id"]
+
+        if action == "remove":
+            for user_id in await store.async_registry_removed(entity_id):
+                _LOGGER.info("Removed deleted entity %s from favorites of user %s", entity_id, user_id)
+                async_fire_changed_event(hass, store, "remove", user_id, entity_id)
+            for list_id in await store.async_shared_registry_changed("remove", entity_id):
+                async_fire_shared_event(hass, store, "remove", list_id, entity_id)
+            return
+
+        if action != "update":
+            return
+
+        if old_entity_id := event.data.get("old_entity_id"):
+            for user_id in await store.async_registry_renamed(old_entity_id, entity_id):
+                async_fire_changed_event(
+                    hass, store, "batch", user_id, entity_id, [old_entity_id, entity_id]
+                )
+            for list_id in await store.async_shared_registry_changed(
+                "rename", old_entity_id, entity_id
+            ):
+                async_fire_shared_event(
+                    hass, store, "batch", list_id, entity_id, [old_entity_id, entity_id]
+                )
+
+        changes = event.data.get("changes", {})
+        if "area_id" in changes or "device_id" in changes:
+            for user_id in await store.async_refresh_areas([entity_id]):
+                async_fire_changed_event(hass, store, "update", user_id, entity_id)
+            for list_id in await store.async_shared_registry_changed("area", entity_id):
+                async_fire_shared_event(hass, store, "update", list_id, entity_id)
+
+    async def async_device_registry_updated(event: Event) -> None:
+        if event.data["action"] != "update" or "area_id" not in event.data.get("changes", {}):
+            return
+
+        entity_registry = er.async_get(hass)
+        entity_ids = [
+            entry.entity_id
+            for entry in er.async_entries_for_device(entity_registry, event.data["device_id"])
+        ]
+        for user_id, changed in (await store.async_refresh_areas(entity_ids)).items():
+            if len(changed) == 1:
+                async_fire_changed_event(hass, store, "update", user_id, changed[0])
+            else:
+                async_fire_changed_event(hass, store, "batch", user_id, None, changed)
+        for entity_id in entity_ids:
+            for list_id in await store.async_shared_registry_changed("area", entity_id):
+                async_fire_shared_event(hass, store, "update", list_id, entity_id)
+
+    entry.async_on_unload(
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, async_entity_registry_updated)
+    )
+    entry.async_on_unload(
+        hass.bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, async_device_registry_updated)
+    )
+
+
+@callback
+def async_setup_usage_tracking(
+    hass: HomeAssistant, entry: ConfigEntry, store: FavoritesStore
+) -> None:
+    """Count a use whenever a user calls a service on one of their favorites.
+
+    Covers the cards, which call the entities' services directly, as well
+    as favorites.control, which passes on the caller's context.
+    """
+
+    @callback
+    def async_service_called(event: Event) -> None:
+        if (user_id := event.context.user_id) is None or event.data.get("domain") == DOMAIN:
+            return
+        entity_ids = (event.data.get("service_data") or {}).get(ATTR_ENTITY_ID)
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        if not isinstance(entity_ids, list):
+            return
+        for entity_id in entity_ids:
+            if store.get_view_item(user_id, entity_id) is not None:
+                store.usage.record(user_id, entity_id)
+
+    entry.async_on_unload(hass.bus.async_listen(EVENT_CALL_SERVICE, async_service_called))
+
+
+def _admin_only(
+    hass: HomeAssistant, handler: Callable[[ServiceCall], Awaitable[ServiceResponse]]
+) -> Callable[[ServiceCall], Awaitable[ServiceResponse]]:
+    """Wrap a service handler so only admins and automations can call it.
+
+    The same check as async_register_admin_service, which cannot register
+    services that return a response.
+    """
+
+    async def admin_handler(call: ServiceCall) -> ServiceResponse:
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None:
+                raise UnknownUser(context=call.context)
+            if not user.is_admin:
+                raise Unauthorized(context=call.context)
+        return await handler(call)
+
+    return admin_handler
+
+
 async def async_register_services(hass: HomeAssistant, store: FavoritesStore) -> None:
     """Register services."""
 
     @callback
-    def fire_changed_event(action: str, user_id: str, entity_id: str | None = None) -> None:
+    def fire_changed_event(
+        action: str,
+        user_id: str,
+        entity_id: str | None = None,
+        entity_ids: list[str] | None = None,
+    ) -> None:
         """Fire event when favorites change."""
-        hass.bus.async_fire(
-            EVENT_FAVORITES_CHANGED,
-            {
-                "action": action,
-                "user_id": user_id,
-                "entity_id": entity_id,
-                "favorites": store.get_user_entity_ids(user_id),
-            },
-        )
+        async_fire_changed_event(hass, store, action, user_id, entity_id, entity_ids)
 
     async def handle_add(call: ServiceCall) -> None:
         user_id = call.data[ATTR_USER_ID]
@@ -358,9 +1908,16 @@ async def async_register_services(hass: HomeAssistant, store: FavoritesStore) ->
 
     async def handle_reorder(call: ServiceCall) -> None:
         user_id = call.data[ATTR_USER_ID]
-        await store.async_reorder(user_id, call.data[ATTR_ENTITY_IDS])
-        _LOGGER.info("Reordered favorites for user %s", user_id)
-        fire_changed_event("reorder", user_id, None)
+        if await store.async_reorder(user_id, call.data[ATTR_ENTITY_IDS]):
+            _LOGGER.info("Reordered favorites for user %s", user_id)
+            fire_changed_event("reorder", user_id, None, store.get_user_entity_ids(user_id))
+
+    async def handle_move(call: ServiceCall) -> None:
+        user_id = call.data[ATTR_USER_ID]
+        entity_id = call.data[ATTR_ENTITY_ID]
+        if await store.async_move(user_id, entity_id, call.data[ATTR_POSITION]):
+            _LOGGER.info("Moved %s to position %d for user %s", entity_id, call.data[ATTR_POSITION], user_id)
+            fire_changed_event("move", user_id, entity_id)
 
     async def handle_clear(call: ServiceCall) -> None:
         user_id = call.data[ATTR_USER_ID]
@@ -376,8 +1933,203 @@ async def async_register_services(hass: HomeAssistant, store: FavoritesStore) ->
             _LOGGER.info("Updated %s for user %s - name: %s", entity_id, user_id, custom_name or "(default)")
             fire_changed_event("update", user_id, entity_id)
 
+    async def _apply(user_id: str, operations: list[dict[str, Any]]) -> ServiceResponse:
+        results = await store.async_apply(user_id, operations)
+        changed = [result[ATTR_ENTITY_ID] for result in results if result["changed"]]
+        if changed:
+            _LOGGER.info("Applied %d favorites changes for user %s", len(changed), user_id)
+            fire_changed_event("batch", user_id, None, list(dict.fromkeys(changed)))
+        return {"results": results}
+
+    async def handle_add_many(call: ServiceCall) -> ServiceResponse:
+        return await _apply(call.data[ATTR_USER_ID], [
+            {ATTR_OP: "add", ATTR_ENTITY_ID: entity_id}
+            for entity_id in call.data[ATTR_ENTITY_IDS]
+        ])
+
+    async def handle_remove_many(call: ServiceCall) -> ServiceResponse:
+        return await _apply(call.data[ATTR_USER_ID], [
+            {ATTR_OP: "remove", ATTR_ENTITY_ID: entity_id}
+            for entity_id in call.data[ATTR_ENTITY_IDS]
+        ])
+
+    async def handle_apply(call: ServiceCall) -> ServiceResponse:
+        return await _apply(call.data[ATTR_USER_ID], call.data[ATTR_OPERATIONS])
+
+    async def handle_get(call: ServiceCall) -> ServiceResponse:
+        user_id = call.data[ATTR_USER_ID]
+        await store.async_ensure_loaded(user_id)
+        if call.data[ATTR_ORDER_BY] == ORDER_BY_USAGE:
+            return {"items": [
+                {**item, ORDER_BY_USAGE: round(store.usage.score(user_id, item["entity_id"]), 2)}
+                for item in store.get_user_items_by_usage(user_id)
+            ]}
+        return {"items": [dict(item) for item in store.get_user_view(user_id)]}
+
+    @callback
+    def fire_shared_event(
+        action: str,
+        list_id: str,
+        entity_ids: list[str],
+        user_ids: list[str] | None = None,
+    ) -> None:
+        """Fire event when a shared list changes."""
+        entity_id = entity_ids[0] if len(entity_ids) == 1 else None
+        async_fire_shared_event(hass, store, action, list_id, entity_id, entity_ids, user_ids)
+
+    async def handle_shared_add(call: ServiceCall) -> None:
+        list_id = call.data[ATTR_LIST_ID]
+        if added := await store.async_shared_add(
+            list_id, call.data[ATTR_ENTITY_IDS], call.data.get(ATTR_NAME)
+        ):
+            _LOGGER.info("Added %d favorites to shared list %s", len(added), list_id)
+            fire_shared_event("add" if len(added) == 1 else "batch", list_id, added)
+
+    async def handle_shared_remove(call: ServiceCall) -> None:
+        list_id = call.data[ATTR_LIST_ID]
+        if removed := await store.async_shared_remove(list_id, call.data[ATTR_ENTITY_IDS]):
+            _LOGGER.info("Removed %d favorites from shared list %s", len(removed), list_id)
+            fire_shared_event("remove" if len(removed) == 1 else "batch", list_id, removed)
+
+    async def handle_shared_delete(call: ServiceCall) -> None:
+        list_id = call.data[ATTR_LIST_ID]
+        await store.async_wait_loaded()
+        if list_id not in store.shared.lists:
+            _LOGGER.warning("Shared favorites list %s does not exist", list_id)
+            return
+        user_ids = await store.async_shared_delete(list_id)
+        _LOGGER.info("Deleted shared favorites list %s", list_id)
+        fire_shared_event("delete", list_id, [], user_ids)
+
+    async def handle_subscribe(call: ServiceCall) -> None:
+        user_id = call.data[ATTR_USER_ID]
+        list_id = call.data[ATTR_LIST_ID]
+        await store.async_wait_loaded()
+        if list_id not in store.shared.lists:
+            _LOGGER.warning("Shared favorites list %s does not exist", list_id)
+            return
+        if await store.async_subscribe(user_id, list_id):
+            _LOGGER.info("Subscribed user %s to shared list %s", user_id, list_id)
+            fire_changed_event("subscribe", user_id, None)
+
+    async def handle_unsubscribe(call: ServiceCall) -> None:
+        user_id = call.data[ATTR_USER_ID]
+        list_id = call.data[ATTR_LIST_ID]
+        if await store.async_unsubscribe(user_id, list_id):
+            _LOGGER.info("Unsubscribed user %s from shared list %s", user_id, list_id)
+            fire_changed_event("unsubscribe", user_id, None)
+
+    async def handle_purge_history(call: ServiceCall) -> ServiceResponse:
+        if not hass.services.has_service("recorder", "purge_entities"):
+            _LOGGER.warning("Recorder is not loaded, nothing to purge")
+            return {"entity_ids": []}
+
+        entity_ids = [
+            entry.entity_id
+            for entry in er.async_get(hass).entities.values()
+            if entry.platform == DOMAIN and entry.domain == "sensor"
+        ]
+        if entity_ids:
+            await hass.services.async_call(
+                "recorder",
+                "purge_entities",
+                {"entity_id": entity_ids, ATTR_KEEP_DAYS: call.data[ATTR_KEEP_DAYS]},
+                blocking=True,
+            )
+            _LOGGER.info("Purged recorded history of %s", ", ".join(entity_ids))
+        return {"entity_ids": entity_ids}
+
+    async def handle_export(call: ServiceCall) -> ServiceResponse:
+        if (path := resolve_path(hass, call.data[ATTR_PATH])) is None:
+            raise HomeAssistantError(
+                f"Favorites can only be exported to a .ndjson file in {EXPORT_DIR}"
+            )
+        # user_counts is only complete once storage has loaded
+        await store.async_wait_loaded()
+        user_ids = call.data.get(ATTR_USER_ID) or list(store.user_counts)
+        try:
+            result = await async_export(hass, store, path, user_ids)
+        except FileExistsError as err:
+            raise HomeAssistantError(
+                f"Not overwriting {path}, which is not a favorites export"
+            ) from err
+        _LOGGER.info("Exported %d favorites of %d users to %s", result["favorites"], result["users"], path)
+        return result
+
+    async def handle_import(call: ServiceCall) -> ServiceResponse:
+        if (path := resolve_path(hass, call.data[ATTR_PATH])) is None:
+            raise HomeAssistantError(
+                f"Favorites can only be imported from a .ndjson file in {EXPORT_DIR}"
+            )
+
+        @callback
+        def on_batch(added: dict[str, list[str]]) -> None:
+            for user_id, entity_ids in added.items():
+                fire_changed_event("batch", user_id, None, entity_ids)
+
+        try:
+            return await async_import(
+                hass,
+                store,
+                path,
+                call.data[ATTR_USER_MAP],
+                call.data[ATTR_SKIP_MISSING],
+                call.data[ATTR_BATCH_SIZE],
+                on_batch,
+            )
+        except FileNotFoundError as err:
+            raise HomeAssistantError(f"Favorites import file {path} not found") from err
+
+    async def handle_control(call: ServiceCall) -> ServiceResponse:
+        user_id = call.data[ATTR_USER_ID]
+        action = call.data[ATTR_ACTION]
+        await store.async_ensure_loaded(user_id)
+        entity_ids = store.select_entity_ids(
+            user_id, call.data.get(ATTR_DOMAIN), call.data.get(ATTR_AREA_ID)
+        )
+
+        start = perf_counter()
+        results: dict[str, dict[str, Any]] = {}
+        # (domain, service) -> entity_ids, so each service is called once
+        batches: dict[tuple[str, str], list[str]] = {}
+        for entity_id in entity_ids:
+            domain = entity_id.split(".", 1)[0]
+            if (service := CONTROL_SERVICES.get(domain, {}).get(action)) is None:
+                results[entity_id] = {ATTR_ENTITY_ID: entity_id, "result": "unsupported"}
+                continue
+            state = hass.states.get(entity_id)
+            if state is None or state.state == STATE_UNAVAILABLE:
+                results[entity_id] = {ATTR_ENTITY_ID: entity_id, "result": "unavailable"}
+                continue
+            batches.setdefault((domain, service), []).append(entity_id)
+
+        outcomes = await asyncio.gather(
+            *(
+                hass.services.async_call(
+                    domain, service, {ATTR_ENTITY_ID: batch}, blocking=True, context=call.context
+                )
+                for (domain, service), batch in batches.items()
+            ),
+            return_exceptions=True,
+        )
+        for ((domain, service), batch), outcome in zip(batches.items(), outcomes):
+            if isinstance(outcome, BaseException):
+                _LOGGER.warning("Calling %s.%s for favorites of user %s failed: %s", domain, service, user_id, outcome)
+            for entity_id in batch:
+                results[entity_id] = {ATTR_ENTITY_ID: entity_id, "service": f"{domain}.{service}"}
+                if isinstance(outcome, BaseException):
+                    results[entity_id].update(result="error", error=str(outcome) or type(outcome).__name__)
+                else:
+                    results[entity_id]["result"] = "ok"
+
+        return {
+            "results": [results[entity_id] for entity_id in entity_ids],
+            "calls": len(batches),
+            "elapsed_ms": round((perf_counter() - start) * 1000, 1),
+        }
+
     hass.services.async_register(
-        DOMAIN, SERVICE_ADD, handle_add,
+        DOMAIN, SERVICE_ADD, store.metrics.wrap(f"service.{SERVICE_ADD}", handle_add),
         schema=vol.Schema({
             vol.Required(ATTR_USER_ID): cv.string,
             vol.Required(ATTR_ENTITY_ID): cv.entity_id,
@@ -387,7 +2139,7 @@ async def async_register_services(hass: HomeAssistant, store: FavoritesStore) ->
     )
 
     hass.services.async_register(
-        DOMAIN, SERVICE_REMOVE, handle_remove,
+        DOMAIN, SERVICE_REMOVE, store.metrics.wrap(f"service.{SERVICE_REMOVE}", handle_remove),
         schema=vol.Schema({
             vol.Required(ATTR_USER_ID): cv.string,
             vol.Required(ATTR_ENTITY_ID): cv.entity_id,
@@ -395,7 +2147,7 @@ async def async_register_services(hass: HomeAssistant, store: FavoritesStore) ->
     )
 
     hass.services.async_register(
-        DOMAIN, SERVICE_TOGGLE, handle_toggle,
+        DOMAIN, SERVICE_TOGGLE, store.metrics.wrap(f"service.{SERVICE_TOGGLE}", handle_toggle),
         schema=vol.Schema({
             vol.Required(ATTR_USER_ID): cv.string,
             vol.Required(ATTR_ENTITY_ID): cv.entity_id,
@@ -403,7 +2155,7 @@ async def async_register_services(hass: HomeAssistant, store: FavoritesStore) ->
     )
 
     hass.services.async_register(
-        DOMAIN, SERVICE_REORDER, handle_reorder,
+        DOMAIN, SERVICE_REORDER, store.metrics.wrap(f"service.{SERVICE_REORDER}", handle_reorder),
         schema=vol.Schema({
             vol.Required(ATTR_USER_ID): cv.string,
             vol.Required(ATTR_ENTITY_IDS): cv.ensure_list,
@@ -411,17 +2163,161 @@ async def async_register_services(hass: HomeAssistant, store: FavoritesStore) ->
     )
 
     hass.services.async_register(
-        DOMAIN, SERVICE_CLEAR, handle_clear,
+        DOMAIN, SERVICE_MOVE, store.metrics.wrap(f"service.{SERVICE_MOVE}", handle_move),
+        schema=vol.Schema({
+            vol.Required(ATTR_USER_ID): cv.string,
+            vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+            vol.Required(ATTR_POSITION): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        }),
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_CLEAR, store.metrics.wrap(f"service.{SERVICE_CLEAR}", handle_clear),
         schema=vol.Schema({
             vol.Required(ATTR_USER_ID): cv.string,
         }),
     )
 
     hass.services.async_register(
-        DOMAIN, SERVICE_UPDATE, handle_update,
+        DOMAIN, SERVICE_UPDATE, store.metrics.wrap(f"service.{SERVICE_UPDATE}", handle_update),
         schema=vol.Schema({
             vol.Required(ATTR_USER_ID): cv.string,
             vol.Required(ATTR_ENTITY_ID): cv.entity_id,
             vol.Optional(ATTR_CUSTOM_NAME): vol.Any(cv.string, None),
         }),
     )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_ADD_MANY, store.metrics.wrap(f"service.{SERVICE_ADD_MANY}", handle_add_many),
+        schema=vol.Schema({
+            vol.Required(ATTR_USER_ID): cv.string,
+            vol.Required(ATTR_ENTITY_IDS): cv.entity_ids,
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REMOVE_MANY, store.metrics.wrap(f"service.{SERVICE_REMOVE_MANY}", handle_remove_many),
+        schema=vol.Schema({
+            vol.Required(ATTR_USER_ID): cv.string,
+            vol.Required(ATTR_ENTITY_IDS): cv.entity_ids,
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY, store.metrics.wrap(f"service.{SERVICE_APPLY}", handle_apply),
+        schema=vol.Schema({
+            vol.Required(ATTR_USER_ID): cv.string,
+            vol.Required(ATTR_OPERATIONS): vol.All(cv.ensure_list, [
+                vol.Schema({
+                    vol.Required(ATTR_OP): vol.In(OPS),
+                    vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+                    vol.Optional(ATTR_CUSTOM_NAME): vol.Any(cv.string, None),
+                    vol.Optional(ATTR_CUSTOM_ICON): vol.Any(cv.icon, None),
+                })
+            ]),
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_GET, store.metrics.wrap(f"service.{SERVICE_GET}", handle_get),
+        schema=vol.Schema({
+            vol.Required(ATTR_USER_ID): cv.string,
+            vol.Optional(ATTR_ORDER_BY, default=ORDER_BY_MANUAL): vol.In(
+                [ORDER_BY_MANUAL, ORDER_BY_USAGE]
+            ),
+        }),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_CONTROL, store.metrics.wrap(f"service.{SERVICE_CONTROL}", handle_control),
+        schema=vol.Schema({
+            vol.Required(ATTR_USER_ID): cv.string,
+            vol.Required(ATTR_ACTION): vol.In(CONTROL_ACTIONS),
+            vol.Optional(ATTR_DOMAIN): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional(ATTR_AREA_ID): vol.All(cv.ensure_list, [cv.string]),
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT,
+        store.metrics.wrap(f"service.{SERVICE_EXPORT}", _admin_only(hass, handle_export)),
+        schema=vol.Schema({
+            vol.Optional(ATTR_PATH, default=DEFAULT_EXPORT_PATH): cv.string,
+            vol.Optional(ATTR_USER_ID): vol.All(cv.ensure_list, [cv.string]),
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT,
+        store.metrics.wrap(f"service.{SERVICE_IMPORT}", _admin_only(hass, handle_import)),
+        schema=vol.Schema({
+            vol.Optional(ATTR_PATH, default=DEFAULT_EXPORT_PATH): cv.string,
+            vol.Optional(ATTR_USER_MAP, default={}): {cv.string: cv.string},
+            vol.Optional(ATTR_SKIP_MISSING, default=True): cv.boolean,
+            vol.Optional(ATTR_BATCH_SIZE, default=DEFAULT_IMPORT_BATCH_SIZE): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=10000)
+            ),
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SHARED_ADD,
+        store.metrics.wrap(f"service.{SERVICE_SHARED_ADD}", handle_shared_add),
+        schema=vol.Schema({
+            vol.Required(ATTR_LIST_ID): cv.slug,
+            vol.Required(ATTR_ENTITY_IDS): cv.entity_ids,
+            vol.Optional(ATTR_NAME): cv.string,
+        }),
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SHARED_REMOVE,
+        store.metrics.wrap(f"service.{SERVICE_SHARED_REMOVE}", handle_shared_remove),
+        schema=vol.Schema({
+            vol.Required(ATTR_LIST_ID): cv.slug,
+            vol.Required(ATTR_ENTITY_IDS): cv.entity_ids,
+        }),
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SHARED_DELETE,
+        store.metrics.wrap(f"service.{SERVICE_SHARED_DELETE}", handle_shared_delete),
+        schema=vol.Schema({
+            vol.Required(ATTR_LIST_ID): cv.slug,
+        }),
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SUBSCRIBE, store.metrics.wrap(f"service.{SERVICE_SUBSCRIBE}", handle_subscribe),
+        schema=vol.Schema({
+            vol.Required(ATTR_USER_ID): cv.string,
+            vol.Required(ATTR_LIST_ID): cv.slug,
+        }),
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_UNSUBSCRIBE,
+        store.metrics.wrap(f"service.{SERVICE_UNSUBSCRIBE}", handle_unsubscribe),
+        schema=vol.Schema({
+            vol.Required(ATTR_USER_ID): cv.string,
+            vol.Required(ATTR_LIST_ID): cv.slug,
+        }),
+    )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PURGE_HISTORY,
+        store.metrics.wrap(f"service.{SERVICE_PURGE_HISTORY}", handle_purge_history),
+        schema=vol.Schema({
+            vol.Optional(ATTR_KEEP_DAYS, default=0): cv.positive_int,
+        }),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,113 @@
+"""Serve the Favorites cards with content-hashed URLs and precompressed variants."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import gzip
+import hashlib
+from http import HTTPStatus
+import logging
+import os
+
+import aiohttp
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+
+try:
+    import brotli
+except ImportError:  # Optional; only gzip variants are written without it
+    brotli = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _aiohttp_serves_brotli() -> bool:
+    """Return whether aiohttp's FileResponse serves .br variants (3.10 and later)."""
+    try:
+        return tuple(int(part) for part in aiohttp.__version__.split(".")[:2]) >= (3, 10)
+    except ValueError:
+        return False
+
+
+# Older aiohttp only serves .gz variants, so .br files would never be used
+SERVE_BROTLI = brotli is not None and _aiohttp_serves_brotli()
+
+# A URL carrying the current hash never changes content; any other URL
+# (no hash, or a stale one) must be revalidated
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "no-cache"
+
+
+def _write_variant(
+    path: str,
+    content: bytes,
+    compress: Callable[[bytes], bytes],
+    decompress: Callable[[bytes], bytes],
+) -> None:
+    """Write a compressed variant of content unless an up-to-date one exists."""
+    try:
+        with open(path, "rb") as file:
+            if decompress(file.read()) == content:
+                return
+    except Exception:  # Missing or corrupt, (re)write it
+        pass
+
+    try:
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(compress(content))
+        os.replace(f"{path}.tmp", path)
+    except OSError as err:
+        _LOGGER.debug("Could not write %s, serving it uncompressed: %s", path, err)
+
+
+def prepare_card_files(www_path: str, filenames: Iterable[str]) -> dict[str, str]:
+    """Hash the card files and write their .gz (and, if served, .br) variants next to them.
+
+    Does blocking I/O, so it runs in the executor. Returns filename -> content
+    hash for the files that exist.
+    """
+    hashes: dict[str, str] = {}
+    for filename in filenames:
+        path = os.path.join(www_path, filename)
+        try:
+            with open(path, "rb") as file:
+                content = file.read()
+        except OSError:
+            continue
+
+        hashes[filename] = hashlib.sha256(content).hexdigest()[:12]
+        # Fixed mtime, so the same content always gives the same bytes
+        _write_variant(
+            f"{path}.gz", content, lambda data: gzip.compress(data, 9, mtime=0), gzip.decompress
+        )
+        if SERVE_BROTLI:
+            _write_variant(f"{path}.br", content, brotli.compress, brotli.decompress)
+    return hashes
+
+
+class CardAssetView(HomeAssistantView):
+    """Serve the card files, cached for good when requested with their hash.
+
+    aiohttp's FileResponse picks the .gz variant, or from aiohttp 3.10 on
+    the .br variant, when the browser accepts it.
+    """
+
+    requires_auth = False
+    name = "favorites:cards"
+
+    def __init__(self, url_path: str, www_path: str, hashes: dict[str, str]) -> None:
+        self.url = f"{url_path}/{{filename}}"
+        self.www_path = www_path
+        self.hashes = hashes
+
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        # Only the known card files, never arbitrary paths
+        if (file_hash := self.hashes.get(filename)) is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        cache_control = (
+            CACHE_IMMUTABLE if request.query.get("v") == file_hash else CACHE_REVALIDATE
+        )
+        return web.FileResponse(
+            os.path.join(self.www_path, filename),
+            headers={"Cache-Control": cache_control},
+        )
@@ -35,12 +35,21 @@ class FavoritesActiveSensor(BinarySensorEntity):
         self._update_state()
 
     def _update_state(self) -> None:
-        total = sum(len(items) for items in self._store.users.values())
-        self._attr_is_on = total > 0
+        self._attr_is_on = self._store.total_count > 0
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
+        if not self._store.loaded:
+            async def async_write_when_loaded() -> None:
+                await self._store.async_wait_loaded()
+                self._update_state()
+                self.async_write_ha_state()
+
+            self.hass.async_create_background_task(
+                async_write_when_loaded(), f"{DOMAIN} binary sensor load"
+            )
+
         @callback
         def async_favorites_changed(event) -> None:
             self._update_state()
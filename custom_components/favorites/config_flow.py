@@ -3,10 +3,29 @@ from __future__ import annotations
 
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from . import DOMAIN
+from . import (
+    CONF_DEBUG_METRICS,
+    CONF_EVENT_FORMAT,
+    CONF_RECORDER_FRIENDLY,
+    CONF_SAVE_DELAY,
+    CONF_STORAGE_LAYOUT,
+    DEFAULT_DEBUG_METRICS,
+    DEFAULT_EVENT_FORMAT,
+    DEFAULT_RECORDER_FRIENDLY,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_STORAGE_LAYOUT,
+    DOMAIN,
+    EVENT_FORMAT_DELTA,
+    EVENT_FORMAT_FULL,
+    STORAGE_LAYOUT_SHARDED,
+    STORAGE_LAYOUT_SINGLE,
+)
 
 
 class FavoritesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -24,3 +43,50 @@ class FavoritesConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_create_entry(title="Favorites", data={})
 
         return self.async_show_form(step_id="user")
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> FavoritesOptionsFlow:
+        return FavoritesOptionsFlow(config_entry)
+
+
+class FavoritesOptionsFlow(config_entries.OptionsFlow):
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    CONF_SAVE_DELAY,
+                    default=options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+                vol.Optional(
+                    CONF_EVENT_FORMAT,
+                    default=options.get(CONF_EVENT_FORMAT, DEFAULT_EVENT_FORMAT),
+                ): vol.In([EVENT_FORMAT_FULL, EVENT_FORMAT_DELTA]),
+                vol.Optional(
+                    CONF_STORAGE_LAYOUT,
+                    default=options.get(CONF_STORAGE_LAYOUT, DEFAULT_STORAGE_LAYOUT),
+                ): vol.In([STORAGE_LAYOUT_SINGLE, STORAGE_LAYOUT_SHARDED]),
+                vol.Optional(
+                    CONF_RECORDER_FRIENDLY,
+                    default=options.get(CONF_RECORDER_FRIENDLY, DEFAULT_RECORDER_FRIENDLY),
+                ): bool,
+                vol.Optional(
+                    CONF_DEBUG_METRICS,
+                    default=options.get(CONF_DEBUG_METRICS, DEFAULT_DEBUG_METRICS),
+                ): bool,
+            }),
+        )
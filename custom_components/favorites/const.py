@@ -1,9 +1,24 @@
 """Constants for the Favorites integration."""
 
 DOMAIN = "favorites"
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 STORAGE_KEY = DOMAIN
 
+CONF_SAVE_DELAY = "save_delay"
+DEFAULT_SAVE_DELAY = 2
+CONF_EVENT_FORMAT = "event_format"
+EVENT_FORMAT_FULL = "full"
+EVENT_FORMAT_DELTA = "delta"
+DEFAULT_EVENT_FORMAT = EVENT_FORMAT_FULL
+CONF_STORAGE_LAYOUT = "storage_layout"
+STORAGE_LAYOUT_SINGLE = "single"
+STORAGE_LAYOUT_SHARDED = "sharded"
+DEFAULT_STORAGE_LAYOUT = STORAGE_LAYOUT_SINGLE
+CONF_DEBUG_METRICS = "debug_metrics"
+DEFAULT_DEBUG_METRICS = False
+CONF_RECORDER_FRIENDLY = "recorder_friendly"
+DEFAULT_RECORDER_FRIENDLY = False
+
 
 SERVICE_ADD = "add"
 SERVICE_REMOVE = "remove"
@@ -11,6 +26,20 @@ SERVICE_TOGGLE = "toggle"
 SERVICE_REORDER = "reorder"
 SERVICE_CLEAR = "clear"
 SERVICE_UPDATE = "update"
+SERVICE_ADD_MANY = "add_many"
+SERVICE_REMOVE_MANY = "remove_many"
+SERVICE_APPLY = "apply"
+SERVICE_GET = "get"
+SERVICE_PURGE_HISTORY = "purge_history"
+SERVICE_CONTROL = "control"
+SERVICE_EXPORT = "export"
+SERVICE_MOVE = "move"
+SERVICE_IMPORT = "import"
+SERVICE_SHARED_ADD = "shared_add"
+SERVICE_SHARED_REMOVE = "shared_remove"
+SERVICE_SHARED_DELETE = "shared_delete"
+SERVICE_SUBSCRIBE = "subscribe"
+SERVICE_UNSUBSCRIBE = "unsubscribe"
 
 
 ATTR_ENTITY_ID = "entity_id"
@@ -18,6 +47,32 @@ ATTR_USER_ID = "user_id"
 ATTR_CUSTOM_NAME = "custom_name"
 ATTR_CUSTOM_ICON = "custom_icon"
 ATTR_ENTITY_IDS = "entity_ids"
+ATTR_OPERATIONS = "operations"
+ATTR_OP = "op"
+ATTR_KEEP_DAYS = "keep_days"
+ATTR_ACTION = "action"
+ATTR_DOMAIN = "domain"
+ATTR_AREA_ID = "area_id"
+ATTR_ORDER_BY = "order_by"
+ATTR_PATH = "path"
+ATTR_POSITION = "position"
+ATTR_USER_MAP = "user_map"
+ATTR_SKIP_MISSING = "skip_missing"
+ATTR_BATCH_SIZE = "batch_size"
+ATTR_LIST_ID = "list_id"
+ATTR_NAME = "name"
+
+EXPORT_DIR = "favorites_exports"
+DEFAULT_EXPORT_PATH = "favorites_export.ndjson"
+DEFAULT_IMPORT_BATCH_SIZE = 500
+
+CONTROL_ACTIONS = ("turn_on", "turn_off", "toggle")
+
+GROUP_BY_AREA = "area"
+GROUP_BY_DOMAIN = "domain"
+
+ORDER_BY_MANUAL = "order"
+ORDER_BY_USAGE = "usage"
 
 
 EVENT_FAVORITES_CHANGED = "favorites_changed"
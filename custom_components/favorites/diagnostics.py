@@ -0,0 +1,42 @@
+"""Diagnostics support for the Favorites integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import DOMAIN, FavoritesStore
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    store: FavoritesStore = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "options": dict(entry.options),
+        "store": {
+            "loaded": store.loaded,
+            "layout": "sharded" if store.sharded else "single",
+            "save_delay": store.save_delay,
+            "event_format": store.event_format,
+            "users": len(store.user_counts),
+            "loaded_users": len(store.users),
+            # Per-user counts without the user IDs
+            "favorites_per_user": sorted(store.user_counts.values(), reverse=True),
+            "total_count": store.total_count,
+            "domain_counts": dict(store.domain_counts),
+            "area_count": len(store.area_counts),
+            "pending_saves": store.pending_saves,
+            "flush_count": store.flush_count,
+            "shared_lists": sorted(
+                (
+                    {"favorites": len(shared["items"]), "subscribers": len(shared["subscribers"])}
+                    for shared in store.shared.lists.values()
+                ),
+                key=lambda shared: (-shared["favorites"], -shared["subscribers"]),
+            ),
+        },
+        "metrics": store.metrics.as_dict(),
+    }
@@ -0,0 +1,136 @@
+"""Timing and size metrics for the Favorites integration's hot paths."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager, nullcontext
+import json
+from time import perf_counter
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+_NOOP = nullcontext()
+
+
+class _Timing:
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count, 3) if self.count else 0,
+            "max_ms": round(self.max, 3),
+            "histogram_ms": dict(zip(labels, self.buckets)),
+        }
+
+
+class _Size:
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.last = 0
+
+    def add(self, size: int) -> None:
+        self.count += 1
+        self.total += size
+        self.max = max(self.max, size)
+        self.last = size
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_bytes": round(self.total / self.count) if self.count else 0,
+            "max_bytes": self.max,
+            "last_bytes": self.last,
+        }
+
+
+class FavoritesMetrics:
+    """Call counts, latency histograms and serialized sizes per named path.
+
+    While disabled every hook returns immediately: measure() hands back a
+    shared no-op context and nothing is timed or serialized.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._timings: dict[str, _Timing] = {}
+        self._sizes: dict[str, _Size] = {}
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        self._timings = {}
+        self._sizes = {}
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record_time(name, (perf_counter() - start) * 1000)
+
+    def measure(self, name: str) -> Any:
+        """Return a context manager that times its block under ``name``."""
+        return self._measure(name) if self.enabled else _NOOP
+
+    def record_time(self, name: str, ms: float) -> None:
+        if (timing := self._timings.get(name)) is None:
+            timing = self._timings[name] = _Timing()
+        timing.add(ms)
+
+    def record_size(self, name: str, data: Any) -> None:
+        """Record the JSON size of ``data`` under ``name``."""
+        if not self.enabled:
+            return
+        if (size := self._sizes.get(name)) is None:
+            size = self._sizes[name] = _Size()
+        size.add(len(json.dumps(data, default=str)))
+
+    def wrap(
+        self, name: str, handler: Callable[[Any], Awaitable[_T]]
+    ) -> Callable[[Any], Awaitable[_T]]:
+        """Wrap a service handler so its calls are timed under ``name``."""
+
+        async def measured_handler(call: Any) -> _T:
+            if not self.enabled:
+                return await handler(call)
+            with self._measure(name):
+                return await handler(call)
+
+        return measured_handler
+
+    @property
+    def service_calls(self) -> int:
+        """Return the number of measured service calls."""
+        return sum(
+            timing.count for name, timing in self._timings.items()
+            if name.startswith("service.")
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "timings": {name: timing.as_dict() for name, timing in sorted(self._timings.items())},
+            "sizes": {name: size.as_dict() for name, size in sorted(self._sizes.items())},
+        }
@@ -6,10 +6,13 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import slugify
 
 from . import DOMAIN, EVENT_FAVORITES_CHANGED, FavoritesStore
+from .shared import event_concerns
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,7 +23,43 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     store: FavoritesStore = hass.data[DOMAIN]["store"]
-    async_add_entities([FavoritesSensor(hass, store)], True)
+    user_sensors: dict[str, FavoritesUserSensor] = {}
+    entities: list[SensorEntity] = [FavoritesSensor(hass, store)]
+    if store.metrics.enabled:
+        entities.append(FavoritesDebugSensor(store))
+    async_add_entities(entities, True)
+
+    @callback
+    def async_add_user_sensors(user_ids) -> None:
+        new_sensors = []
+        for user_id in user_ids:
+            if user_id and user_id not in user_sensors:
+                user_sensors[user_id] = FavoritesUserSensor(store, user_id)
+                new_sensors.append(user_sensors[user_id])
+        if new_sensors:
+            # Not updated before adding: that would load every user's shard
+            async_add_entities(new_sensors)
+
+    @callback
+    def async_favorites_changed(event) -> None:
+        """Create the sensor for a user the first time they show up."""
+        async_add_user_sensors([event.data.get("user_id")])
+
+    async def async_add_loaded_users() -> None:
+        await store.async_wait_loaded()
+        async_add_user_sensors(list(store.user_counts))
+
+    if store.loaded:
+        async_add_user_sensors(list(store.user_counts))
+    else:
+        # The store loads in the background; the users are known once it is done
+        config_entry.async_create_background_task(
+            hass, async_add_loaded_users(), f"{DOMAIN} user sensors"
+        )
+
+    config_entry.async_on_unload(
+        hass.bus.async_listen(EVENT_FAVORITES_CHANGED, async_favorites_changed)
+    )
 
 
 class FavoritesSensor(SensorEntity):
@@ -30,6 +69,8 @@ class FavoritesSensor(SensorEntity):
     _attr_unique_id = "favorites_list"
     _attr_icon = "mdi:star"
     _attr_should_poll = False
+    # Never written to the recorder (Home Assistant 2024.3+)
+    _unrecorded_attributes = frozenset({"user_counts", "domain_counts", "area_counts"})
 
     def __init__(self, hass: HomeAssistant, store: FavoritesStore) -> None:
         self._hass = hass
@@ -37,18 +78,143 @@ class FavoritesSensor(SensorEntity):
         self._update_native_value()
 
     def _update_native_value(self) -> None:
-        total = sum(len(items) for items in self._store.users.values())
-        self._attr_native_value = total
+        self._attr_native_value = self._store.total_count
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        import copy
-        users = copy.deepcopy(self._store.users)
-        total_count = sum(len(items) for items in users.values())
-        
+        # The store keeps these counts up to date; copy the small dicts so the
+        # previous state's attributes are not mutated along with them
+        metrics = self._store.metrics
+        with metrics.measure("attributes.list"):
+            # Save counters are in diagnostics: the state is only written on
+            # changes, so here they would lag behind every delayed write
+            attributes: dict[str, Any] = {"count": self._store.total_count}
+            if not self._store.recorder_friendly:
+                attributes["user_counts"] = dict(self._store.user_counts)
+                attributes["domain_counts"] = dict(self._store.domain_counts)
+                attributes["area_counts"] = dict(self._store.area_counts)
+        metrics.record_size("attributes.list", attributes)
+        return attributes
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        if not self._store.loaded:
+            async def async_write_when_loaded() -> None:
+                await self._store.async_wait_loaded()
+                self._update_native_value()
+                self.async_write_ha_state()
+
+            self.hass.async_create_background_task(
+                async_write_when_loaded(), f"{DOMAIN} list sensor load"
+            )
+
+        @callback
+        def async_favorites_changed(event) -> None:
+            self._update_native_value()
+            self.async_write_ha_state()
+
+        self.async_on_remove(
+            self._hass.bus.async_listen(
+                EVENT_FAVORITES_CHANGED, async_favorites_changed
+            )
+        )
+
+    async def async_update(self) -> None:
+        self._update_native_value()
+
+
+class FavoritesUserSensor(SensorEntity):
+    """Favorites of a single user, so one user's change only touches their entity."""
+
+    _attr_icon = "mdi:star-outline"
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"items"})
+
+    def __init__(self, store: FavoritesStore, user_id: str) -> None:
+        self._store = store
+        self._user_id = user_id
+        self._attr_name = f"Favorites {user_id}"
+        self._attr_unique_id = f"favorites_user_{user_id}"
+        self.entity_id = f"sensor.{DOMAIN}_{slugify(user_id)}"
+        self._update_native_value()
+
+    def _update_native_value(self) -> None:
+        self._attr_native_value = self._store.user_counts.get(self._user_id, 0)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        metrics = self._store.metrics
+        with metrics.measure("attributes.user"):
+            attributes: dict[str, Any] = {"user_id": self._user_id}
+            # In recorder-friendly mode the items are only available through
+            # the websocket API and the favorites.get service
+            if not self._store.recorder_friendly and self._store.is_user_loaded(self._user_id):
+                attributes["items"] = [
+                    dict(item) for item in self._store.get_user_items(self._user_id)
+                ]
+            # Shared items are not copied here, only the lists they come from
+            if list_ids := self._store.shared.lists_for(self._user_id):
+                attributes["shared_lists"] = list(list_ids)
+        metrics.record_size("attributes.user", attributes)
+        return attributes
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+
+        @callback
+        def async_favorites_changed(event) -> None:
+            # Shared list events name their subscribers in user_ids
+            if not event_concerns(event, self._user_id):
+                return
+            self._update_native_value()
+            self.async_write_ha_state()
+
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                EVENT_FAVORITES_CHANGED, async_favorites_changed
+            )
+        )
+
+    async def async_update(self) -> None:
+        """Refresh on request, e.g. homeassistant.update_entity.
+
+        The count comes from the shard summaries, so a shard that is not
+        loaded yet is only read here when its items are exposed.
+        """
+        if not self._store.recorder_friendly:
+            await self._store.async_ensure_loaded(self._user_id)
+        self._update_native_value()
+
+
+class FavoritesDebugSensor(SensorEntity):
+    """Hot-path metrics, only created when debug metrics are enabled."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Favorites Metrics"
+    _attr_unique_id = "favorites_metrics"
+    _attr_icon = "mdi:speedometer"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"timings", "sizes"})
+
+    def __init__(self, store: FavoritesStore) -> None:
+        self._store = store
+        self._update_native_value()
+
+    def _update_native_value(self) -> None:
+        self._attr_native_value = self._store.metrics.service_calls
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        metrics = self._store.metrics.as_dict()
+        # The full histograms are in the diagnostics download
         return {
-            "users": users,
-            "count": total_count,
+            "timings": {
+                name: {key: value for key, value in timing.items() if key != "histogram_ms"}
+                for name, timing in metrics["timings"].items()
+            },
+            "sizes": metrics["sizes"],
         }
 
     async def async_added_to_hass(self) -> None:
@@ -60,7 +226,7 @@ class FavoritesSensor(SensorEntity):
             self.async_write_ha_state()
 
         self.async_on_remove(
-            self._hass.bus.async_listen(
+            self.hass.bus.async_listen(
                 EVENT_FAVORITES_CHANGED, async_favorites_changed
             )
         )
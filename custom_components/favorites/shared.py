@@ -0,0 +1,224 @@
+"""Shared favorite lists that users subscribe to, with per-user overlays."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+SHARED_STORAGE_VERSION = 1
+
+# Per-user fields laid over a shared item; "hidden" drops it from the view
+OVERLAY_FIELDS = ("custom_name", "custom_icon", "hidden", "order")
+
+
+def event_concerns(event: Event, user_id: str) -> bool:
+    """Return whether a change event is for the user, directly or via a shared list."""
+    return event.data.get("user_id") == user_id or user_id in event.data.get("user_ids", ())
+
+
+class SharedLists:
+    """Named favorite lists stored once and merged into each subscriber's view.
+
+    A list holds its items and its subscribers. What a user changes about a
+    shared item (name, order, hiding it) is kept in that user's overlay, so
+    the list itself is never copied per user.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        self._store: Store = Store(hass, SHARED_STORAGE_VERSION, key)
+        # list_id -> {"name", "items", "subscribers"}
+        self._lists: dict[str, dict[str, Any]] = {}
+        # user_id -> entity_id -> overlay fields
+        self._overlays: dict[str, dict[str, dict[str, Any]]] = {}
+        # list_id -> entity_id -> item, and user_id -> subscribed list_ids
+        self._items: dict[str, dict[str, dict[str, Any]]] = {}
+        self._lists_by_user: dict[str, list[str]] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the stored lists and overlays."""
+        if data := await self._store.async_load():
+            self._lists = data.get("lists", {})
+            self._overlays = data.get("overlays", {})
+        self._items = {
+            list_id: {item["entity_id"]: item for item in shared["items"]}
+            for list_id, shared in self._lists.items()
+        }
+        self._lists_by_user = {}
+        for list_id, shared in self._lists.items():
+            for user_id in shared["subscribers"]:
+                self._lists_by_user.setdefault(user_id, []).append(list_id)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        return {"lists": self._lists, "overlays": self._overlays}
+
+    async def async_schedule_save(self, delay: float) -> None:
+        """Save now, or coalesce with other changes when there is a delay."""
+        if delay <= 0:
+            await self._store.async_save(self._data_to_save())
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, delay)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now, if there are any."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    @property
+    def lists(self) -> Mapping[str, dict[str, Any]]:
+        """Return all shared lists (read-only view)."""
+        return self._lists
+
+    def get_items(self, list_id: str) -> list[dict[str, Any]]:
+        """Return a shared list's items in order."""
+        return self._lists.get(list_id, {}).get("items", [])
+
+    def get_item(self, list_id: str, entity_id: str) -> dict[str, Any] | None:
+        """Return a shared list's item for an entity."""
+        return self._items.get(list_id, {}).get(entity_id)
+
+    def lists_for(self, user_id: str) -> list[str]:
+        """Return the IDs of the lists a user subscribes to."""
+        return self._lists_by_user.get(user_id, [])
+
+    def subscribers(self, list_id: str) -> list[str]:
+        """Return the users subscribed to a list."""
+        return list(self._lists.get(list_id, {}).get("subscribers", []))
+
+    def lists_with(self, entity_id: str) -> list[str]:
+        """Return the IDs of the lists that contain an entity."""
+        return [list_id for list_id, items in self._items.items() if entity_id in items]
+
+    def set_items(self, list_id: str, items: list[dict[str, Any]], name: str | None = None) -> None:
+        """Replace a list's items, creating the list if needed."""
+        shared = self._lists.get(list_id) or {"name": list_id, "items": [], "subscribers": []}
+        self._lists[list_id] = {**shared, "name": name or shared["name"], "items": items}
+        self._items[list_id] = {item["entity_id"]: item for item in items}
+
+    def delete(self, list_id: str) -> list[str]:
+        """Delete a list; returns its former subscribers."""
+        if (shared := self._lists.pop(list_id, None)) is None:
+            return []
+        self._items.pop(list_id, None)
+        for user_id in shared["subscribers"]:
+            self._lists_by_user[user_id].remove(list_id)
+            if not self._lists_by_user[user_id]:
+                del self._lists_by_user[user_id]
+            self.prune_overlays(user_id)
+        return shared["subscribers"]
+
+    def subscribe(self, user_id: str, list_id: str) -> bool:
+        """Subscribe a user to an existing list."""
+        if (shared := self._lists.get(list_id)) is None or user_id in shared["subscribers"]:
+            return False
+        shared["subscribers"] = [*shared["subscribers"], user_id]
+        self._lists_by_user.setdefault(user_id, []).append(list_id)
+        return True
+
+    def unsubscribe(self, user_id: str, list_id: str) -> bool:
+        """Unsubscribe a user from a list, dropping overlays it no longer needs."""
+        if list_id not in self.lists_for(user_id):
+            return False
+        shared = self._lists[list_id]
+        shared["subscribers"] = [other for other in shared["subscribers"] if other != user_id]
+        self._lists_by_user[user_id].remove(list_id)
+        if not self._lists_by_user[user_id]:
+            del self._lists_by_user[user_id]
+        self.prune_overlays(user_id)
+        return True
+
+    def get_overlay(self, user_id: str, entity_id: str) -> dict[str, Any]:
+        """Return a user's overlay for a shared entity."""
+        return self._overlays.get(user_id, {}).get(entity_id, {})
+
+    def set_overlay(self, user_id: str, entity_id: str, **fields: Any) -> None:
+        """Set overlay fields; None removes a field, and empty overlays are dropped."""
+        overlays = self._overlays.setdefault(user_id, {})
+        overlay = {**overlays.get(entity_id, {}), **fields}
+        overlay = {key: value for key, value in overlay.items() if value is not None}
+        if overlay:
+            overlays[entity_id] = overlay
+        else:
+            overlays.pop(entity_id, None)
+        if not overlays:
+            del self._overlays[user_id]
+
+    def is_placed(self, user_id: str, entity_id: str) -> bool:
+        """Return whether the user gave a shared item its own order key."""
+        return "order" in self.get_overlay(user_id, entity_id)
+
+    def placed_order(self, user_id: str) -> int:
+        """Return the highest order key the user gave a shared item, or 0."""
+        return max(
+            (overlay["order"] for overlay in self._overlays.get(user_id, {}).values()
+             if "order" in overlay),
+            default=0,
+        )
+
+    def rename_overlays(self, old_entity_id: str, new_entity_id: str) -> None:
+        """Point every overlay of a renamed entity at its new entity_id."""
+        for overlays in self._overlays.values():
+            if (overlay := overlays.pop(old_entity_id, None)) is not None:
+                overlays.setdefault(new_entity_id, overlay)
+
+    def prune_overlays(self, user_id: str) -> None:
+        """Drop a user's overlays for entities none of their lists contain."""
+        if (overlays := self._overlays.get(user_id)) is None:
+            return
+        list_ids = self.lists_for(user_id)
+        for entity_id in list(overlays):
+            if not any(entity_id in self._items[list_id] for list_id in list_ids):
+                del overlays[entity_id]
+        if not overlays:
+            del self._overlays[user_id]
+
+    def _merge(self, user_id: str, list_id: str, item: dict[str, Any]) -> dict[str, Any] | None:
+        overlay = self._overlays.get(user_id, {}).get(item["entity_id"])
+        if overlay is None:
+            return {**item, "list_id": list_id}
+        if overlay.get("hidden"):
+            return None
+        return {**item, **overlay, "list_id": list_id}
+
+    def view_item(
+        self, user_id: str, entity_id: str, include_hidden: bool = False
+    ) -> dict[str, Any] | None:
+        """Return a user's merged copy of a shared item, from their first list that has it."""
+        for list_id in self.lists_for(user_id):
+            if (item := self._items[list_id].get(entity_id)) is not None:
+                if include_hidden:
+                    return {**item, "list_id": list_id}
+                return self._merge(user_id, list_id, item)
+        return None
+
+    def view(self, user_id: str, own_items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Merge a user's own items with their subscribed lists, in order.
+
+        Own items win over shared items for the same entity. Shared items are
+        copies carrying their list_id, with the user's overlay applied. Own
+        items and the shared items the user placed share one order; the other
+        shared items follow them list by list, in subscription order and then
+        in their list's order.
+        """
+        if not (list_ids := self.lists_for(user_id)):
+            return own_items
+        seen = {item["entity_id"] for item in own_items}
+        keyed = [((0, item.get("order", 0)), item) for item in own_items]
+        for block, list_id in enumerate(list_ids, 1):
+            for item in self._lists[list_id]["items"]:
+                if item["entity_id"] in seen:
+                    continue
+                seen.add(item["entity_id"])
+                if (view_item := self._merge(user_id, list_id, item)) is not None:
+                    if self.is_placed(user_id, item["entity_id"]):
+                        keyed.append(((0, view_item["order"]), view_item))
+                    else:
+                        keyed.append(((block, view_item.get("order", 0)), view_item))
+        # Stable, so own items come first where keys are equal
+        keyed.sort(key=lambda pair: pair[0])
+        return [item for _, item in keyed]
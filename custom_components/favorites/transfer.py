@@ -0,0 +1,189 @@
+"""Streaming NDJSON export and import of favorites."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import partial
+from itertools import islice
+import json
+import logging
+import os
+from typing import IO, TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+from .const import ATTR_CUSTOM_ICON, ATTR_CUSTOM_NAME, ATTR_ENTITY_ID, ATTR_USER_ID, EXPORT_DIR
+
+if TYPE_CHECKING:
+    from . import FavoritesStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fields written per favorite, besides user_id and entity_id; the line
+# order is the favorites' order
+EXPORT_FIELDS = (ATTR_CUSTOM_NAME, ATTR_CUSTOM_ICON, "added_at")
+MAX_REPORTED_ERRORS = 20
+# First line of every export; only files starting with it are overwritten
+EXPORT_HEADER = {"favorites_export": 1}
+EXPORT_SUFFIX = ".ndjson"
+
+RECORD_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_USER_ID): cv.string,
+        vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+        vol.Optional(ATTR_CUSTOM_NAME): vol.Any(cv.string, None),
+        vol.Optional(ATTR_CUSTOM_ICON): vol.Any(cv.icon, None),
+        vol.Optional("added_at"): vol.Any(cv.string, None),
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+
+def resolve_path(hass: HomeAssistant, path: str) -> str | None:
+    """Resolve a path relative to the export directory.
+
+    Returns None for paths outside it and for files without the .ndjson suffix.
+    """
+    export_dir = os.path.realpath(hass.config.path(EXPORT_DIR))
+    full_path = os.path.realpath(os.path.join(export_dir, path))
+    if full_path.startswith(export_dir + os.sep) and full_path.endswith(EXPORT_SUFFIX):
+        return full_path
+    return None
+
+
+def _open_export(path: str) -> IO[str]:
+    """Open an export file for writing, refusing files an export did not write."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            first_line = file.readline()
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    else:
+        try:
+            is_export = json.loads(first_line) == EXPORT_HEADER
+        except ValueError:
+            is_export = False
+        if not is_export:
+            raise FileExistsError(path)
+    file = open(path, "w", encoding="utf-8")
+    file.write(json.dumps(EXPORT_HEADER) + "\n")
+    return file
+
+
+def _export_lines(user_id: str, items: list[dict[str, Any]]) -> str:
+    lines = []
+    for item in items:
+        record = {ATTR_USER_ID: user_id, ATTR_ENTITY_ID: item["entity_id"]}
+        record.update(
+            (field, item[field]) for field in EXPORT_FIELDS if item.get(field) is not None
+        )
+        lines.append(json.dumps(record) + "\n")
+    return "".join(lines)
+
+
+async def async_export(
+    hass: HomeAssistant, store: FavoritesStore, path: str, user_ids: Iterable[str]
+) -> dict[str, Any]:
+    """Write one NDJSON line per favorite, one user at a time.
+
+    Only one user's favorites are serialized at a time, and every write
+    happens in the executor. Raises FileExistsError if path exists and is
+    not an earlier export.
+    """
+    users = favorites = 0
+    file: IO[str] = await hass.async_add_executor_job(_open_export, path)
+    try:
+        for user_id in user_ids:
+            await store.async_ensure_loaded(user_id)
+            if not (items := store.get_user_items(user_id)):
+                continue
+            await hass.async_add_executor_job(file.write, _export_lines(user_id, items))
+            users += 1
+            favorites += len(items)
+    finally:
+        await hass.async_add_executor_job(file.close)
+    return {"path": path, "users": users, "favorites": favorites}
+
+
+def _read_lines(file: IO[str], count: int) -> list[str]:
+    return list(islice(file, count))
+
+
+async def async_import(
+    hass: HomeAssistant,
+    store: FavoritesStore,
+    path: str,
+    user_map: dict[str, str],
+    skip_missing: bool,
+    batch_size: int,
+    on_batch: Callable[[dict[str, list[str]]], None],
+) -> dict[str, Any]:
+    """Read an NDJSON export in chunks of batch_size lines and add the favorites.
+
+    Each chunk is validated and committed with one write, so memory use
+    stays bounded by the batch size however large the file is. on_batch is
+    called with the entity IDs added per user after every committed batch.
+    """
+    entity_registry = er.async_get(hass)
+    result: dict[str, Any] = {
+        "imported": 0,
+        "existing": 0,
+        "missing": 0,
+        "invalid": 0,
+        "batches": 0,
+        "errors": [],
+    }
+
+    def invalid(line_number: int, reason: str) -> None:
+        result["invalid"] += 1
+        if len(result["errors"]) < MAX_REPORTED_ERRORS:
+            result["errors"].append(f"line {line_number}: {reason}")
+
+    file: IO[str] = await hass.async_add_executor_job(partial(open, path, encoding="utf-8"))
+    line_number = 0
+    try:
+        while lines := await hass.async_add_executor_job(_read_lines, file, batch_size):
+            batch: dict[str, list[dict[str, Any]]] = {}
+            for line in lines:
+                line_number += 1
+                if not line.strip():
+                    continue
+                try:
+                    if (data := json.loads(line)) == EXPORT_HEADER:
+                        continue
+                    record = RECORD_SCHEMA(data)
+                except (ValueError, vol.Invalid) as err:
+                    invalid(line_number, str(err))
+                    continue
+
+                entity_id = record[ATTR_ENTITY_ID]
+                if skip_missing and (
+                    entity_registry.async_get(entity_id) is None
+                    and hass.states.get(entity_id) is None
+                ):
+                    result["missing"] += 1
+                    continue
+                user_id = user_map.get(record[ATTR_USER_ID], record[ATTR_USER_ID])
+                batch.setdefault(user_id, []).append(record)
+
+            if not batch:
+                continue
+            added = await store.async_import_batch(batch)
+            count = sum(len(entity_ids) for entity_ids in added.values())
+            result["imported"] += count
+            result["existing"] += sum(len(records) for records in batch.values()) - count
+            result["batches"] += 1
+            if added:
+                on_batch(added)
+    finally:
+        await hass.async_add_executor_job(file.close)
+
+    _LOGGER.info(
+        "Imported %d favorites from %s in %d batches (%d already present, %d missing, %d invalid)",
+        result["imported"], path, result["batches"],
+        result["existing"], result["missing"], result["invalid"],
+    )
+    return result
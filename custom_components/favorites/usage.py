@@ -0,0 +1,149 @@
+"""Time-decayed usage counters with an incrementally maintained top-K per user."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+import heapq
+import math
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+USAGE_STORAGE_VERSION = 1
+USAGE_HALF_LIFE = 7 * 24 * 3600  # seconds; a use counts half as much a week later
+USAGE_TOP_K = 50
+USAGE_SAVE_DELAY = 60  # seconds; uses are batched into one write per minute at most
+
+
+class FavoritesUsage:
+    """How much each user uses each of their favorites, decayed over time.
+
+    Scores use forward decay: a use at time t adds 2 ** ((t - epoch) / half_life),
+    kept as a log2 so it never overflows. Decaying every score by the same
+    factor does not change their order, so stored scores never have to be
+    touched as time passes, and a use only moves its own entity up in the
+    user's top-K list.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        half_life: float = USAGE_HALF_LIFE,
+        top_k: int = USAGE_TOP_K,
+        save_delay: float = USAGE_SAVE_DELAY,
+    ) -> None:
+        self._store: Store = Store(hass, USAGE_STORAGE_VERSION, key)
+        self.half_life = half_life
+        self.top_k = top_k
+        self.save_delay = save_delay
+        self._epoch = time.time()
+        # user_id -> entity_id -> log2 of the forward-decayed score
+        self._scores: dict[str, dict[str, float]] = {}
+        # user_id -> [(-score, entity_id)], best first, at most top_k long
+        self._top: dict[str, list[tuple[float, str]]] = {}
+        # Users whose top list lost an entry and is refilled on the next read
+        self._short: set[str] = set()
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the stored scores."""
+        if data := await self._store.async_load():
+            self._epoch = data.get("epoch", self._epoch)
+            self._scores = data.get("users", {})
+        self._top = {}
+        self._short = set(self._scores)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        # A copy: the scores keep changing while the write is serialized
+        return {
+            "epoch": self._epoch,
+            "users": {user_id: dict(scores) for user_id, scores in self._scores.items()},
+        }
+
+    @callback
+    def _schedule_save(self) -> None:
+        # Scheduled once per batch; later uses in the same window ride along
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, self.save_delay)
+
+    async def async_flush(self) -> None:
+        """Write pending scores now, if there are any."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def record(self, user_id: str, entity_id: str, now: float | None = None) -> None:
+        """Count one use of a favorite."""
+        weight = ((time.time() if now is None else now) - self._epoch) / self.half_life
+        scores = self._scores.setdefault(user_id, {})
+        if (old := scores.get(entity_id)) is None:
+            score = weight
+        else:
+            # log2(2 ** old + 2 ** weight), without leaving the log domain
+            high, low = max(old, weight), min(old, weight)
+            score = high + math.log2(1 + 2 ** (low - high))
+        scores[entity_id] = score
+        self._promote(user_id, entity_id, old, score)
+        self._schedule_save()
+
+    def _promote(self, user_id: str, entity_id: str, old: float | None, score: float) -> None:
+        top = self._top.setdefault(user_id, [])
+        was_ranked = old is not None and self._discard(top, old, entity_id)
+        if not was_ranked and len(top) >= self.top_k and (-score, entity_id) > top[-1]:
+            return
+        insort(top, (-score, entity_id))
+        if len(top) > self.top_k:
+            top.pop()
+
+    @staticmethod
+    def _discard(top: list[tuple[float, str]], score: float, entity_id: str) -> bool:
+        index = bisect_left(top, (-score, entity_id))
+        if index < len(top) and top[index] == (-score, entity_id):
+            del top[index]
+            return True
+        return False
+
+    @callback
+    def forget(self, user_id: str, entity_id: str) -> None:
+        """Drop the score of an entity that is no longer a favorite."""
+        if (scores := self._scores.get(user_id)) is None:
+            return
+        if (score := scores.pop(entity_id, None)) is None:
+            return
+        if not scores:
+            del self._scores[user_id]
+        if self._discard(self._top.get(user_id, []), score, entity_id):
+            self._short.add(user_id)
+        self._schedule_save()
+
+    @callback
+    def rename(self, user_id: str, old_entity_id: str, new_entity_id: str) -> None:
+        """Move a score to an entity's new entity_id."""
+        if (score := self._scores.get(user_id, {}).get(old_entity_id)) is None:
+            return
+        self.forget(user_id, old_entity_id)
+        self._scores.setdefault(user_id, {})[new_entity_id] = score
+        self._promote(user_id, new_entity_id, None, score)
+
+    def top(self, user_id: str) -> list[str]:
+        """Return the user's most used entity IDs, best first."""
+        if user_id in self._short:
+            # Entries were dropped; only a selection of the best is needed,
+            # never a sort of all scores
+            self._short.discard(user_id)
+            scores = self._scores.get(user_id, {})
+            best = heapq.nlargest(self.top_k, scores.items(), key=lambda pair: pair[1])
+            self._top[user_id] = sorted((-score, entity_id) for entity_id, score in best)
+        return [entity_id for _, entity_id in self._top.get(user_id, [])]
+
+    def score(self, user_id: str, entity_id: str, now: float | None = None) -> float:
+        """Return the decayed number of uses of a favorite as of now."""
+        if (score := self._scores.get(user_id, {}).get(entity_id)) is None:
+            return 0.0
+        weight = ((time.time() if now is None else now) - self._epoch) / self.half_life
+        return 2 ** (score - weight)
@@ -0,0 +1,291 @@
+"""WebSocket API for the Favorites integration."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    DOMAIN,
+    EVENT_FAVORITES_CHANGED,
+    GROUP_BY_AREA,
+    GROUP_BY_DOMAIN,
+    ORDER_BY_MANUAL,
+    ORDER_BY_USAGE,
+)
+from .shared import event_concerns
+
+if TYPE_CHECKING:
+    from . import FavoritesStore
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the favorites websocket commands."""
+    websocket_api.async_register_command(hass, websocket_list)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    websocket_api.async_register_command(hass, websocket_groups)
+    websocket_api.async_register_command(hass, websocket_subscribe_states)
+
+
+# The attributes the cards actually read; everything else is dropped from
+# the favorites state stream
+STATE_ATTRIBUTES = (
+    "friendly_name",
+    "icon",
+    "brightness",
+    "temperature",
+    "min_temp",
+    "max_temp",
+    "target_temp_step",
+    "hvac_modes",
+    "fan_mode",
+    "fan_modes",
+    "current_position",
+)
+
+
+def _get_store(hass: HomeAssistant) -> FavoritesStore | None:
+    return hass.data.get(DOMAIN, {}).get("store")
+
+
+def _user_items(store: FavoritesStore, user_id: str) -> list[dict[str, Any]]:
+    return [dict(item) for item in store.get_user_view(user_id)]
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "favorites/list",
+        vol.Optional("order_by", default=ORDER_BY_MANUAL): vol.In(
+            [ORDER_BY_MANUAL, ORDER_BY_USAGE]
+        ),
+    }
+)
+@websocket_api.async_response
+async def websocket_list(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the favorites of the connection's user."""
+    if (store := _get_store(hass)) is None:
+        connection.send_error(msg["id"], "not_loaded", "Favorites is not loaded")
+        return
+
+    user_id = connection.user.id
+    await store.async_ensure_loaded(user_id)
+    if msg["order_by"] == ORDER_BY_USAGE:
+        items = [
+            {**item, ORDER_BY_USAGE: round(store.usage.score(user_id, item["entity_id"]), 2)}
+            for item in store.get_user_items_by_usage(user_id)
+        ]
+    else:
+        items = _user_items(store, user_id)
+    connection.send_result(msg["id"], {"items": items})
+
+
+@websocket_api.websocket_command({vol.Required("type"): "favorites/subscribe"})
+@websocket_api.async_response
+async def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream changes to the favorites of the connection's user.
+
+    The first message is a snapshot of the user's items, shared lists
+    included; every following message only describes what changed.
+    """
+    if (store := _get_store(hass)) is None:
+        connection.send_error(msg["id"], "not_loaded", "Favorites is not loaded")
+        return
+
+    user_id = connection.user.id
+    await store.async_ensure_loaded(user_id)
+
+    @callback
+    def async_favorites_changed(event: Event) -> None:
+        if not event_concerns(event, user_id):
+            return
+
+        action = event.data.get("action")
+        entity_id = event.data.get("entity_id")
+        item = store.get_view_item(user_id, entity_id) if entity_id else None
+        if (list_id := event.data.get("list_id")) and item and item.get("list_id") != list_id:
+            # The user sees their own favorite for this entity, not the list's
+            return
+        if action == "remove" and item is not None:
+            # Still in the view through another list or their own favorites
+            action = "update"
+
+        delta: dict[str, Any] = {"action": action}
+        if action in ("add", "update"):
+            if item is None:
+                return
+            delta["item"] = dict(item)
+        elif action == "remove":
+            delta["entity_id"] = entity_id
+        elif action == "reorder":
+            delta["entity_ids"] = store.get_view_entity_ids(user_id)
+        elif action == "move":
+            entity_ids = store.get_view_entity_ids(user_id)
+            if entity_id not in entity_ids:
+                return
+            delta["entity_id"] = entity_id
+            delta["position"] = entity_ids.index(entity_id)
+        else:
+            delta = {"action": "snapshot", "items": _user_items(store, user_id)}
+
+        # Shared list events carry no revision; the user's stays where it is
+        delta["revision"] = event.data.get("revision", store.get_revision(user_id))
+        connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+        EVENT_FAVORITES_CHANGED, async_favorites_changed
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {
+                "action": "snapshot",
+                "items": _user_items(store, user_id),
+                "revision": store.get_revision(user_id),
+            },
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "favorites/groups",
+        vol.Optional("group_by", default=GROUP_BY_AREA): vol.In(
+            [GROUP_BY_AREA, GROUP_BY_DOMAIN]
+        ),
+    }
+)
+@websocket_api.async_response
+async def websocket_groups(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the favorites of the connection's user grouped by area or domain."""
+    if (store := _get_store(hass)) is None:
+        connection.send_error(msg["id"], "not_loaded", "Favorites is not loaded")
+        return
+
+    user_id = connection.user.id
+    await store.async_ensure_loaded(user_id)
+
+    area_registry = ar.async_get(hass)
+    groups = []
+    for key, items in store.get_groups(user_id, msg["group_by"]).items():
+        name = key
+        if msg["group_by"] == GROUP_BY_AREA:
+            area = area_registry.async_get_area(key) if key else None
+            name = area.name if area else None
+        groups.append({"key": key, "name": name, "items": [dict(item) for item in items]})
+
+    # Named groups alphabetically, favorites without an area last
+    groups.sort(key=lambda group: (group["name"] is None, group["name"] or ""))
+    connection.send_result(msg["id"], {"group_by": msg["group_by"], "groups": groups})
+
+
+def _trim_state(state: State | None) -> dict[str, Any] | None:
+    if state is None:
+        return None
+    return {
+        "state": state.state,
+        "attributes": {
+            key: state.attributes[key] for key in STATE_ATTRIBUTES if key in state.attributes
+        },
+    }
+
+
+@websocket_api.websocket_command({vol.Required("type"): "favorites/subscribe_states"})
+@websocket_api.async_response
+async def websocket_subscribe_states(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream the states of the connection user's favorited entities only.
+
+    States are trimmed to the attributes the cards use and only sent when
+    that trimmed view changes. The tracked entities follow the user's
+    favorites as they are added and removed.
+    """
+    if (store := _get_store(hass)) is None:
+        connection.send_error(msg["id"], "not_loaded", "Favorites is not loaded")
+        return
+
+    user_id = connection.user.id
+    await store.async_ensure_loaded(user_id)
+
+    sent: dict[str, dict[str, Any] | None] = {}
+    unsub_states: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_send(entity_ids: set[str], removed: set[str]) -> None:
+        changed = {}
+        for entity_id in entity_ids:
+            trimmed = _trim_state(hass.states.get(entity_id))
+            if entity_id in sent and sent[entity_id] == trimmed:
+                continue
+            sent[entity_id] = changed[entity_id] = trimmed
+        for entity_id in removed:
+            sent.pop(entity_id, None)
+        if changed or removed:
+            connection.send_message(
+                websocket_api.event_message(
+                    msg["id"], {"changed": changed, "removed": sorted(removed)}
+                )
+            )
+
+    @callback
+    def async_state_changed(event: Event) -> None:
+        async_send({event.data["entity_id"]}, set())
+
+    @callback
+    def async_track(entity_ids: set[str]) -> None:
+        nonlocal unsub_states
+        if unsub_states is not None:
+            unsub_states()
+            unsub_states = None
+        if entity_ids:
+            unsub_states = async_track_state_change_event(
+                hass, list(entity_ids), async_state_changed
+            )
+
+    @callback
+    def async_favorites_changed(event: Event) -> None:
+        if not event_concerns(event, user_id):
+            return
+        entity_ids = set(store.get_view_entity_ids(user_id))
+        if entity_ids == sent.keys():
+            return
+        added = entity_ids - sent.keys()
+        removed = sent.keys() - entity_ids
+        async_track(entity_ids)
+        async_send(added, removed)
+
+    unsub_favorites = hass.bus.async_listen(EVENT_FAVORITES_CHANGED, async_favorites_changed)
+
+    @callback
+    def async_unsubscribe() -> None:
+        unsub_favorites()
+        if unsub_states is not None:
+            unsub_states()
+
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
+
+    entity_ids = set(store.get_view_entity_ids(user_id))
+    async_track(entity_ids)
+    async_send(entity_ids, set())
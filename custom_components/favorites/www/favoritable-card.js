@@ -2,6 +2,68 @@
  * Favoritable Card for Home Assistant
  * v2.2.1 - Added user_id support (minimal change from v2.2.0)
  */
+
+/**
+ * One favorites/subscribe subscription shared by every star on the page.
+ * entityIds stays null until the first snapshot, or for good if the
+ * websocket API is unavailable; cards then read the per-user sensor.
+ */
+const favoritesFeed = {
+  connection: null,
+  unsub: null,
+  entityIds: null,
+  cards: new Set(),
+
+  attach(card, hass) {
+    this.cards.add(card);
+    if (!hass.connection || this.connection === hass.connection) return;
+
+    this._unsubscribe();
+    this.connection = hass.connection;
+    this.unsub = hass.connection.subscribeMessage(
+      (msg) => this._handleMessage(msg),
+      { type: 'favorites/subscribe' }
+    );
+    this.unsub.catch((error) => {
+      console.warn('[favoritable-card] Subscription unavailable, using sensor:', error);
+      this.unsub = null;
+      this.entityIds = null;
+    });
+  },
+
+  detach(card) {
+    this.cards.delete(card);
+    if (this.cards.size === 0) {
+      this._unsubscribe();
+      this.connection = null;
+    }
+  },
+
+  _unsubscribe() {
+    if (this.unsub) {
+      this.unsub.then(unsub => unsub()).catch(() => {});
+      this.unsub = null;
+    }
+    this.entityIds = null;
+  },
+
+  _handleMessage(msg) {
+    if (msg.action === 'snapshot') {
+      this.entityIds = new Set(msg.items.map(item => item.entity_id));
+    } else if (!this.entityIds) {
+      return;
+    } else if (msg.action === 'add') {
+      this.entityIds.add(msg.item.entity_id);
+    } else if (msg.action === 'remove') {
+      this.entityIds.delete(msg.entity_id);
+    } else {
+      // update, reorder and move do not change which entities are favorites
+      return;
+    }
+    this.cards.forEach(card => card._refreshFavorite());
+  },
+};
+
 class FavoritableCard extends HTMLElement {
   constructor() {
     super();
@@ -35,12 +97,29 @@ class FavoritableCard extends HTMLElement {
       this._cardElement.hass = hass;
     }
     
-    const sensor = hass.states['sensor.favorites_list'];
-    const userId = hass.user?.id;
-    const users = sensor?.attributes?.users || {};
-    const userItems = userId ? (users[userId] || []) : [];
-    const entityIds = userItems.map(item => item.entity_id);
-    this._isFavorite = entityIds.includes(this._config.entity);
+    if (this.isConnected) favoritesFeed.attach(this, hass);
+    this._refreshFavorite();
+  }
+
+  connectedCallback() {
+    if (this._hass) favoritesFeed.attach(this, this._hass);
+  }
+
+  disconnectedCallback() {
+    favoritesFeed.detach(this);
+  }
+
+  _refreshFavorite() {
+    if (!this._hass) return;
+
+    if (favoritesFeed.entityIds) {
+      this._isFavorite = favoritesFeed.entityIds.has(this._config.entity);
+    } else {
+      const userId = this._hass.user?.id;
+      const sensor = userId ? this._hass.states[`sensor.favorites_${userId}`] : null;
+      const userItems = sensor?.attributes?.items || [];
+      this._isFavorite = userItems.some(item => item.entity_id === this._config.entity);
+    }
     this._updateStarButton();
   }
 
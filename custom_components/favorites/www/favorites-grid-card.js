@@ -225,8 +225,18 @@ class FavoritesGridCardEditor extends HTMLElement {
         <label for="allow_reorder">Allow drag-drop reorder</label>
       </div>
       
+      <div class="editor-row checkbox-row">
+        <input type="checkbox" id="virtualize" ${this._config.virtualize ? 'checked' : ''}>
+        <label for="virtualize">Only render visible tiles (large lists)</label>
+      </div>
+      
       <div class="section-title">Advanced</div>
       
+      <div class="editor-row">
+        <label>Scroll Height (px, visible tiles mode)</label>
+        <input type="number" id="virtual_height" value="${this._config.virtual_height || 600}" min="200" max="2000">
+      </div>
+      
       <div class="editor-row">
         <label>Custom CSS (card-mod style)</label>
         <textarea id="card_mod_style" rows="4" style="width: 100%; padding: 10px 12px; border: 1px solid var(--divider-color, rgba(255,255,255,0.12)); border-radius: 8px; background: var(--card-background-color, rgba(255,255,255,0.05)); color: var(--primary-text-color); font-family: monospace; font-size: 12px; resize: vertical;">${this._config.card_mod?.style || ''}</textarea>
@@ -262,7 +272,14 @@ class FavoritesGridCardEditor extends HTMLElement {
       }
     });
 
-    ['show_empty_message', 'show_climate_controls', 'show_cover_controls', 'light_compact', 'allow_reorder'].forEach(id => {
+    const heightInput = this.shadowRoot.getElementById('virtual_height');
+    if (heightInput) {
+      heightInput.addEventListener('change', (e) => {
+        this._updateConfig('virtual_height', parseInt(e.target.value) || 600);
+      });
+    }
+
+    ['show_empty_message', 'show_climate_controls', 'show_cover_controls', 'light_compact', 'allow_reorder', 'virtualize'].forEach(id => {
       const input = this.shadowRoot.getElementById(id);
       if (input) {
         input.addEventListener('change', (e) => {
@@ -305,6 +322,12 @@ if (!customElements.get('favorites-grid-card-editor')) {
 
 
 
+// Initial tile height estimates for the virtualized grid, replaced by the
+// first measurement of each kind
+const VIRTUAL_TILE_HEIGHTS = { climate: 180, cover: 150, light: 66, standard: 90 };
+const VIRTUAL_ROW_GAP = 10;
+const VIRTUAL_OVERSCAN = 300;
+
 class FavoritesGridCard extends HTMLElement {
   constructor() {
     super();
@@ -315,11 +338,17 @@ class FavoritesGridCard extends HTMLElement {
     this._entityIds = new Set();
     this._lastSensorIds = '';
     this._renderedKey = '';
-    this._isFirstRender = true;
+    this._tiles = new Map();
+    this._virtual = null;
     this._openDropdownId = null;
     this._openFanDropdownId = null;
     this._draggedItem = null;
     this._userId = null;
+    this._unsubFavorites = null;
+    this._subscribed = false;
+    this._subscribeFailed = false;
+    this._unsubStates = null;
+    this._favStates = {};
 
     this._longPressTimer = null;
     this._longPressGlowTimer = null;
@@ -580,9 +609,14 @@ class FavoritesGridCard extends HTMLElement {
       }
     };
     document.addEventListener('click', this._handleDocClick);
+
+    if (this._hass) {
+      this._subscribeFavorites();
+    }
   }
 
   disconnectedCallback() {
+    this._unsubscribeFavorites();
     if (this._handleUpdate) {
       window.removeEventListener('favorites-updated', this._handleUpdate);
     }
@@ -603,6 +637,8 @@ class FavoritesGridCard extends HTMLElement {
       show_cover_controls: true,
       light_compact: true,
       allow_reorder: true,
+      virtualize: false,
+      virtual_height: 600,
       ...config,
     };
     this._smartRender();
@@ -612,9 +648,17 @@ class FavoritesGridCard extends HTMLElement {
     this._hass = hass;
     this._userId = hass.user?.id || null;
 
-    const sensor = hass.states['sensor.favorites_list'];
-    const users = sensor?.attributes?.users || {};
-    const userItems = this._userId ? (users[this._userId] || []) : [];
+    if (!this._unsubFavorites && !this._subscribeFailed && this.isConnected) {
+      this._subscribeFavorites();
+    }
+    if (this._subscribed) {
+      // With the state stream, favorites' states arrive on their own and
+      // unrelated updates in the house can be ignored entirely
+      if (!this._unsubStates) this._updateStates();
+      return;
+    }
+
+    const userItems = this._getUserItems();
     const sensorIds = JSON.stringify(userItems.map(item => item.entity_id));
 
     if (sensorIds !== this._lastSensorIds) {
@@ -628,31 +672,139 @@ class FavoritesGridCard extends HTMLElement {
   _syncFromSensor() {
     if (!this._hass) return;
 
-    const sensor = this._hass.states['sensor.favorites_list'];
-    const users = sensor?.attributes?.users || {};
-    const userItems = this._userId ? (users[this._userId] || []) : [];
+    const userItems = this._getUserItems();
     this._favorites = userItems;
     this._entityIds = new Set(userItems.map(item => item.entity_id));
     this._smartRender();
   }
 
+  // ============================================
+  // WEBSOCKET SUBSCRIPTION
+  // ============================================
+  _subscribeFavorites() {
+    if (this._unsubFavorites || !this._hass?.connection) return;
+
+    this._unsubFavorites = this._hass.connection.subscribeMessage(
+      (msg) => this._handleFavoritesMessage(msg),
+      { type: 'favorites/subscribe' }
+    );
+    this._unsubFavorites.catch((error) => {
+      // Older integration without the websocket API: keep reading the sensor
+      console.warn('[favorites-grid-card] Subscription unavailable, using sensor:', error);
+      this._unsubFavorites = null;
+      this._subscribed = false;
+      this._subscribeFailed = true;
+      this._lastSensorIds = '';
+      this._syncFromSensor();
+    });
+  }
+
+  _subscribeStates() {
+    if (this._unsubStates || !this._hass?.connection) return;
+
+    this._unsubStates = this._hass.connection.subscribeMessage(
+      (msg) => this._handleStatesMessage(msg),
+      { type: 'favorites/subscribe_states' }
+    );
+    this._unsubStates.catch((error) => {
+      console.warn('[favorites-grid-card] State stream unavailable, using hass updates:', error);
+      this._unsubStates = null;
+      this._favStates = {};
+    });
+  }
+
+  _unsubscribeFavorites() {
+    if (this._unsubFavorites) {
+      this._unsubFavorites.then(unsub => unsub()).catch(() => {});
+      this._unsubFavorites = null;
+    }
+    if (this._unsubStates) {
+      this._unsubStates.then(unsub => unsub()).catch(() => {});
+      this._unsubStates = null;
+    }
+    this._favStates = {};
+    this._subscribed = false;
+  }
+
+  _handleStatesMessage(msg) {
+    Object.entries(msg.changed).forEach(([entityId, state]) => {
+      if (state) {
+        this._favStates[entityId] = state;
+      } else {
+        delete this._favStates[entityId];
+      }
+    });
+    msg.removed.forEach(entityId => delete this._favStates[entityId]);
+
+    const changed = Object.keys(msg.changed);
+    if (changed.length > 0) this._updateStates(changed);
+  }
+
+  _getState(entityId) {
+    return this._favStates[entityId] || this._hass?.states[entityId];
+  }
+
+  _handleFavoritesMessage(msg) {
+    if (!this._subscribed) this._subscribeStates();
+    this._subscribed = true;
+
+    if (msg.action === 'snapshot') {
+      this._favorites = msg.items;
+    } else if (msg.action === 'add') {
+      this._favorites = [
+        ...this._favorites.filter(f => f.entity_id !== msg.item.entity_id),
+        msg.item,
+      ];
+    } else if (msg.action === 'update') {
+      this._favorites = this._favorites.map(f => f.entity_id === msg.item.entity_id ? msg.item : f);
+    } else if (msg.action === 'remove') {
+      this._favorites = this._favorites.filter(f => f.entity_id !== msg.entity_id);
+    } else if (msg.action === 'reorder') {
+      const byId = new Map(this._favorites.map(f => [f.entity_id, f]));
+      this._favorites = msg.entity_ids.map(id => byId.get(id)).filter(Boolean);
+    } else if (msg.action === 'move') {
+      const moved = this._favorites.find(f => f.entity_id === msg.entity_id);
+      if (moved) {
+        const favorites = this._favorites.filter(f => f !== moved);
+        favorites.splice(msg.position, 0, moved);
+        this._favorites = favorites;
+      }
+    }
+
+    this._entityIds = new Set(this._favorites.map(f => f.entity_id));
+    this._smartRender();
+  }
+
+  _getUserItems() {
+    if (!this._userId) return [];
+    const sensor = this._hass?.states[`sensor.favorites_${this._userId}`];
+    return sensor?.attributes?.items || [];
+  }
+
   _smartRender() {
-    const newKey = this._favorites.map(f => f.entity_id).join(',') + '_' + (this._config.theme || 'dark');
+    // The shell and stylesheet only depend on the config; favorites changes
+    // are applied tile by tile
+    const configKey = JSON.stringify(this._config);
 
-    if (newKey === this._renderedKey && !this._isFirstRender) {
-      this._updateStates();
+    if (configKey !== this._renderedKey) {
+      this._renderedKey = configKey;
+      this._render();
       return;
     }
 
-    this._renderedKey = newKey;
-    this._isFirstRender = false;
-    this._render();
+    this._reconcile();
   }
 
-  _updateStates() {
-    this._favorites.forEach(fav => {
-      const entity = this._hass?.states[fav.entity_id];
-      const item = this.shadowRoot?.querySelector(`[data-entity="${fav.entity_id}"]`);
+  _updateStates(entityIds = null) {
+    // Off-screen tiles of a virtualized grid are rendered fresh when they
+    // scroll into view, so only the visible window is updated
+    const source = this._virtual ? this._favorites.slice(this._virtual.start, this._virtual.end) : this._favorites;
+    const wanted = entityIds ? new Set(entityIds) : null;
+    const favorites = wanted ? source.filter(fav => wanted.has(fav.entity_id)) : source;
+
+    favorites.forEach(fav => {
+      const entity = this._getState(fav.entity_id);
+      const item = this._getTile(fav.entity_id);
       if (!item || !entity) return;
 
       const domain = fav.entity_id.split('.')[0];
@@ -817,7 +969,7 @@ class FavoritesGridCard extends HTMLElement {
   _toggleFanDropdown(entityId, e) {
     e.stopPropagation();
 
-    const item = this.shadowRoot.querySelector(`[data-entity="${entityId}"]`);
+    const item = this._getTile(entityId);
     const dropdown = item?.querySelector('.fan-dropdown');
 
     if (this._openFanDropdownId === entityId) {
@@ -834,7 +986,7 @@ class FavoritesGridCard extends HTMLElement {
 
   _closeFanDropdown() {
     if (this._openFanDropdownId) {
-      const item = this.shadowRoot.querySelector(`[data-entity="${this._openFanDropdownId}"]`);
+      const item = this._getTile(this._openFanDropdownId);
       const dropdown = item?.querySelector('.fan-dropdown');
       dropdown?.classList.remove('show');
       this._openFanDropdownId = null;
@@ -861,7 +1013,7 @@ class FavoritesGridCard extends HTMLElement {
       this._closeFanDropdown();
       this._openDropdownId = entityId;
 
-      const item = this.shadowRoot.querySelector(`[data-entity="${entityId}"]`);
+      const item = this._getTile(entityId);
       const dropdown = item?.querySelector('.hvac-dropdown');
       if (dropdown) {
         dropdown.classList.add('show');
@@ -871,7 +1023,7 @@ class FavoritesGridCard extends HTMLElement {
 
   _closeDropdown() {
     if (this._openDropdownId) {
-      const item = this.shadowRoot.querySelector(`[data-entity="${this._openDropdownId}"]`);
+      const item = this._getTile(this._openDropdownId);
       const dropdown = item?.querySelector('.hvac-dropdown');
       if (dropdown) {
         dropdown.classList.remove('show');
@@ -893,7 +1045,7 @@ class FavoritesGridCard extends HTMLElement {
   async _climateSetTemp(entityId, delta, e) {
     e.stopPropagation();
 
-    const entity = this._hass?.states[entityId];
+    const entity = this._getState(entityId);
     if (!entity || entity.state === 'off') return;
 
     const currentTemp = entity.attributes?.temperature || 22;
@@ -904,7 +1056,7 @@ class FavoritesGridCard extends HTMLElement {
     let newTemp = currentTemp + (delta * step);
     newTemp = Math.max(minTemp, Math.min(maxTemp, newTemp));
 
-    const tempEl = this.shadowRoot.querySelector(`[data-entity="${entityId}"] .climate-temp`);
+    const tempEl = this._getTile(entityId)?.querySelector('.climate-temp');
     if (tempEl) tempEl.textContent = `${newTemp}°`;
 
     await this._hass.callService('climate', 'set_temperature', {
@@ -958,6 +1110,7 @@ class FavoritesGridCard extends HTMLElement {
   _handleDragEnd(e) {
     e.target.classList.remove('dragging');
     this._draggedItem = null;
+    if (this._virtual) this._renderVirtualWindow(true);
 
     this.shadowRoot.querySelectorAll('.drag-over').forEach(el => {
       el.classList.remove('drag-over');
@@ -968,7 +1121,7 @@ class FavoritesGridCard extends HTMLElement {
     e.preventDefault();
     if (this._draggedItem === entityId) return;
 
-    const item = this.shadowRoot.querySelector(`[data-entity="${entityId}"]`);
+    const item = this._getTile(entityId);
     if (item && !item.classList.contains('dragging')) {
       this.shadowRoot.querySelectorAll('.drag-over').forEach(el => {
         el.classList.remove('drag-over');
@@ -990,12 +1143,16 @@ class FavoritesGridCard extends HTMLElement {
     const [draggedFav] = this._favorites.splice(draggedIndex, 1);
     this._favorites.splice(targetIndex, 0, draggedFav);
 
-    this._renderedKey = '';
+    this.shadowRoot.querySelectorAll('.drag-over').forEach(el => {
+      el.classList.remove('drag-over');
+    });
     this._smartRender();
 
-    const newOrder = this._favorites.map(f => f.entity_id);
-    this._hass.callService('favorites', 'reorder', {
-      entity_ids: newOrder,
+    // Only the moved favorite is sent; the server gives it an order key
+    // between its new neighbours
+    this._hass.callService('favorites', 'move', {
+      entity_id: draggedFav.entity_id,
+      position: targetIndex,
       user_id: this._userId
     });
   }
@@ -1006,7 +1163,7 @@ class FavoritesGridCard extends HTMLElement {
   async _removeFavorite(entityId, e) {
     e.stopPropagation();
 
-    const item = this.shadowRoot.querySelector(`[data-entity="${entityId}"]`);
+    const item = this._getTile(entityId);
     if (item) {
       item.classList.add('removing');
       await new Promise(r => setTimeout(r, 200));
@@ -1031,7 +1188,7 @@ class FavoritesGridCard extends HTMLElement {
   }
 
   _getIcon(fav) {
-    const entity = this._hass?.states[fav.entity_id];
+    const entity = this._getState(fav.entity_id);
     if (fav.custom_icon) return fav.custom_icon;
     if (entity?.attributes?.icon) return entity.attributes.icon;
 
@@ -1052,17 +1209,17 @@ class FavoritesGridCard extends HTMLElement {
 
   _getName(fav) {
     if (fav.custom_name) return fav.custom_name;
-    const entity = this._hass?.states[fav.entity_id];
+    const entity = this._getState(fav.entity_id);
     return entity?.attributes?.friendly_name || fav.entity_id.split('.')[1].replace(/_/g, ' ');
   }
 
-  _render() {
+  _getStyles() {
     const cols = this._config.columns || 2;
+    const virtualHeight = this._config.virtual_height || 600;
     const allowReorder = this._config.allow_reorder !== false;
     const customStyle = this._config.card_mod?.style || '';
 
-    this.shadowRoot.innerHTML = `
-      <style>
+    return `
         :host {
           ${this._getThemeStyles()}
           display: block;
@@ -1109,6 +1266,23 @@ class FavoritesGridCard extends HTMLElement {
           align-items: start;
         }
         
+        .grid.virtual {
+          display: block;
+          max-height: ${virtualHeight}px;
+          overflow-y: auto;
+          overscroll-behavior: contain;
+        }
+        .virtual-row {
+          display: grid;
+          grid-template-columns: repeat(${cols}, minmax(0, 1fr));
+          grid-auto-rows: minmax(28px, auto);
+          gap: 10px;
+          align-items: start;
+          margin-bottom: ${VIRTUAL_ROW_GAP}px;
+        }
+        .virtual-parking { display: none; }
+        .grid.virtual .item { animation: none; }
+        
         @keyframes itemRemove { to { opacity: 0; transform: scale(0.8); } }
         @keyframes itemAdd { from { opacity: 0; transform: scale(0.8); } to { opacity: 1; transform: scale(1); } }
         
@@ -1858,8 +2032,31 @@ class FavoritesGridCard extends HTMLElement {
         .empty-text { color: var(--fgc-text-secondary); font-size: 13px; }
         
         ${customStyle}
-      </style>
-      
+    `;
+  }
+
+  _getStyleSheet() {
+    // Parsed once per distinct style and shared by every card instance
+    const css = this._getStyles();
+    const sheets = FavoritesGridCard._styleSheets;
+    let sheet = sheets.get(css);
+    if (!sheet) {
+      sheet = new CSSStyleSheet();
+      sheet.replaceSync(css);
+      sheets.set(css, sheet);
+    }
+    return sheet;
+  }
+
+  _render() {
+    const useSheets = FavoritesGridCard._supportsAdoptedStyleSheets;
+    if (useSheets) {
+      this.shadowRoot.adoptedStyleSheets = [this._getStyleSheet()];
+    }
+
+    this.shadowRoot.innerHTML = `
+      ${useSheets ? '' : `<style>${this._getStyles()}</style>`}
+
       <div class="card">
         ${this._config.title ? `
           <div class="header">
@@ -1867,17 +2064,17 @@ class FavoritesGridCard extends HTMLElement {
             <span class="count">${this._favorites.length} items</span>
           </div>
         ` : ''}
-        
-        ${this._favorites.length === 0 && this._config.show_empty_message ? `
-          <div class="empty">
-            <div class="empty-icon">⭐</div>
-            <div class="empty-text">${this._config.empty_message}</div>
-          </div>
-        ` : `
-          <div class="grid">
-            ${this._favorites.map(fav => this._renderItem(fav)).join('')}
+
+        <div class="empty" style="display: none;">
+          <div class="empty-icon">⭐</div>
+          <div class="empty-text">${this._config.empty_message}</div>
+        </div>
+        ${this._config.virtualize ? `
+          <div class="grid virtual">
+            <div class="virtual-list"></div>
+            <div class="virtual-parking"></div>
           </div>
-        `}
+        ` : '<div class="grid"></div>'}
       </div>
       
       <div class="rename-overlay">
@@ -1895,12 +2092,286 @@ class FavoritesGridCard extends HTMLElement {
       </div>
     `;
 
+    this._tiles = new Map();
+    this._virtual = null;
+    if (this._config.virtualize) {
+      this._virtual = {
+        pool: new Map(),
+        kindHeights: { ...VIRTUAL_TILE_HEIGHTS },
+        measured: new Set(),
+        offsets: [0],
+        rowCount: 0,
+        start: 0,
+        end: 0,
+        frame: null,
+      };
+      this.shadowRoot.querySelector('.grid').addEventListener(
+        'scroll', () => this._scheduleVirtualWindow(), { passive: true }
+      );
+    }
     this._attachEventListeners();
+    this._reconcile();
+  }
+
+  // ============================================
+  // KEYED RECONCILIATION
+  // ============================================
+  _reconcile() {
+    const grid = this.shadowRoot.querySelector('.grid');
+    if (!grid) return;
+
+    if (this._virtual) {
+      this._layoutVirtual();
+      this._renderVirtualWindow(true);
+    } else {
+      this._reconcileTiles(grid);
+    }
+
+    const isEmpty = this._favorites.length === 0 && this._config.show_empty_message;
+    grid.style.display = isEmpty ? 'none' : '';
+    const emptyEl = this.shadowRoot.querySelector('.empty');
+    if (emptyEl) emptyEl.style.display = isEmpty ? '' : 'none';
+
+    const countEl = this.shadowRoot.querySelector('.count');
+    if (countEl) countEl.textContent = `${this._favorites.length} items`;
+  }
+
+  _reconcileTiles(grid) {
+    const wanted = new Set(this._favorites.map(fav => fav.entity_id));
+    for (const [entityId, tile] of this._tiles) {
+      if (!wanted.has(entityId)) {
+        tile.el.remove();
+        this._tiles.delete(entityId);
+      }
+    }
+
+    const desired = this._favorites.map(fav => {
+      let tile = this._tiles.get(fav.entity_id);
+      if (tile && (tile.customName !== fav.custom_name || tile.customIcon !== fav.custom_icon)) {
+        tile.el.remove();
+        tile = null;
+      }
+      if (!tile) {
+        tile = this._createTile(fav);
+        this._tiles.set(fav.entity_id, tile);
+      }
+      return tile.el;
+    });
+
+    // Tiles already in relative order stay put; only the rest are moved
+    const keep = this._longestOrderedRun(desired, grid);
+    let next = null;
+    for (let i = desired.length - 1; i >= 0; i--) {
+      const el = desired[i];
+      if (!keep.has(el)) grid.insertBefore(el, next);
+      next = el;
+    }
+  }
+
+  _longestOrderedRun(desired, grid) {
+    // Longest increasing subsequence of the tiles' current DOM positions
+    const position = new Map(Array.from(grid.children).map((el, i) => [el, i]));
+    const tails = [];
+    const tailIdx = [];
+    const prev = new Array(desired.length).fill(-1);
+
+    desired.forEach((el, i) => {
+      const pos = position.get(el);
+      if (pos === undefined) return;
+      let lo = 0;
+      let hi = tails.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (tails[mid] < pos) lo = mid + 1; else hi = mid;
+      }
+      tails[lo] = pos;
+      tailIdx[lo] = i;
+      prev[i] = lo > 0 ? tailIdx[lo - 1] : -1;
+    });
+
+    const keep = new Set();
+    for (let i = tailIdx[tails.length - 1] ?? -1; i !== -1; i = prev[i]) {
+      keep.add(desired[i]);
+    }
+    return keep;
+  }
+
+  _createTile(fav) {
+    const el = this._renderTileElement(fav);
+    this._attachItemListeners(el);
+    return { el, kind: this._tileKind(fav), customName: fav.custom_name, customIcon: fav.custom_icon };
+  }
+
+  _renderTileElement(fav) {
+    const template = document.createElement('template');
+    template.innerHTML = this._renderItem(fav).trim();
+    return template.content.firstElementChild;
+  }
+
+  _tileKind(fav) {
+    const domain = fav.entity_id.split('.')[0];
+    if (domain === 'climate' || domain === 'cover') return domain;
+    if (domain === 'light' && this._config.light_compact) return 'light';
+    return 'standard';
+  }
+
+  // ============================================
+  // VIRTUALIZED GRID
+  // ============================================
+  _layoutVirtual() {
+    // Row offsets from the (measured) height of each kind of tile, so the
+    // scroll range is right without rendering every row
+    const v = this._virtual;
+    const cols = this._config.columns || 2;
+    const count = this._favorites.length;
+
+    v.rowCount = Math.ceil(count / cols);
+    v.offsets = new Array(v.rowCount + 1);
+    v.offsets[0] = 0;
+    for (let row = 0; row < v.rowCount; row++) {
+      let height = 0;
+      for (let i = row * cols; i < Math.min((row + 1) * cols, count); i++) {
+        height = Math.max(height, v.kindHeights[this._tileKind(this._favorites[i])]);
+      }
+      v.offsets[row + 1] = v.offsets[row] + height + VIRTUAL_ROW_GAP;
+    }
+  }
+
+  _virtualRowAt(y) {
+    const offsets = this._virtual.offsets;
+    let lo = 0;
+    let hi = this._virtual.rowCount;
+    while (lo < hi) {
+      const mid = (lo + hi + 1) >> 1;
+      if (offsets[mid] <= y) lo = mid; else hi = mid - 1;
+    }
+    return lo;
+  }
+
+  _scheduleVirtualWindow() {
+    if (!this._virtual || this._virtual.frame) return;
+    this._virtual.frame = requestAnimationFrame(() => {
+      if (!this._virtual) return;
+      this._virtual.frame = null;
+      this._renderVirtualWindow();
+    });
+  }
+
+  _renderVirtualWindow(force = false) {
+    const v = this._virtual;
+    const grid = this.shadowRoot.querySelector('.grid');
+    const list = grid?.querySelector('.virtual-list');
+    if (!v || !list) return;
+
+    const cols = this._config.columns || 2;
+    const viewport = grid.clientHeight || this._config.virtual_height || 600;
+    const startRow = Math.min(
+      this._virtualRowAt(Math.max(0, grid.scrollTop - VIRTUAL_OVERSCAN)),
+      Math.max(0, v.rowCount - 1)
+    );
+    const endRow = Math.min(
+      v.rowCount,
+      this._virtualRowAt(grid.scrollTop + viewport + VIRTUAL_OVERSCAN) + 1
+    );
+    const start = startRow * cols;
+    const end = Math.min(endRow * cols, this._favorites.length);
+
+    if (!force && start === v.start && end === v.end) return;
+    v.start = start;
+    v.end = end;
+
+    const visible = this._favorites.slice(start, end);
+    const visibleById = new Map(visible.map(fav => [fav.entity_id, fav]));
+    const parking = grid.querySelector('.virtual-parking');
+
+    // Tiles that scrolled out go back to the pool of their kind
+    for (const [entityId, tile] of this._tiles) {
+      const fav = visibleById.get(entityId);
+      if (fav && tile.customName === fav.custom_name && tile.customIcon === fav.custom_icon) continue;
+      if (!fav && entityId === this._draggedItem) {
+        // The drag source has to stay in the document until dragend
+        parking.appendChild(tile.el);
+        continue;
+      }
+      this._tiles.delete(entityId);
+      tile.el.remove();
+      if (!v.pool.has(tile.kind)) v.pool.set(tile.kind, []);
+      v.pool.get(tile.kind).push(tile.el);
+    }
+
+    const rowCount = endRow - startRow;
+    while (list.children.length < rowCount) {
+      const row = document.createElement('div');
+      row.className = 'virtual-row';
+      list.appendChild(row);
+    }
+    while (list.children.length > rowCount) {
+      list.lastElementChild.remove();
+    }
+
+    visible.forEach((fav, i) => {
+      let tile = this._tiles.get(fav.entity_id);
+      if (!tile) {
+        tile = this._acquireTile(fav);
+        this._tiles.set(fav.entity_id, tile);
+      }
+      const row = list.children[Math.floor(i / cols)];
+      const slot = row.children[i % cols] || null;
+      if (slot !== tile.el) row.insertBefore(tile.el, slot);
+    });
+    Array.from(list.children).forEach((row, r) => {
+      const size = Math.min(cols, visible.length - r * cols);
+      while (row.children.length > size) row.lastElementChild.remove();
+    });
+
+    list.style.paddingTop = `${v.offsets[startRow]}px`;
+    list.style.paddingBottom = `${v.offsets[v.rowCount] - v.offsets[endRow]}px`;
+
+    this._measureVirtualTiles();
+  }
+
+  _acquireTile(fav) {
+    const kind = this._tileKind(fav);
+    const el = this._virtual.pool.get(kind)?.pop();
+    if (!el) return this._createTile(fav);
+
+    // Same kind of tile, so the outer element and its listeners (which read
+    // data-entity when they fire) can be reused as is
+    const fresh = this._renderTileElement(fav);
+    Array.from(fresh.attributes).forEach(attr => el.setAttribute(attr.name, attr.value));
+    el.replaceChildren(...fresh.childNodes);
+    this._attachTileControls(el);
+    return { el, kind, customName: fav.custom_name, customIcon: fav.custom_icon };
+  }
+
+  _measureVirtualTiles() {
+    const v = this._virtual;
+    let changed = false;
+
+    for (const tile of this._tiles.values()) {
+      if (v.measured.has(tile.kind) || !tile.el.isConnected) continue;
+      const height = tile.el.offsetHeight;
+      if (!height) continue;
+      v.measured.add(tile.kind);
+      if (Math.abs(height - v.kindHeights[tile.kind]) > 1) {
+        v.kindHeights[tile.kind] = height;
+        changed = true;
+      }
+    }
+
+    if (changed) {
+      this._layoutVirtual();
+      this._renderVirtualWindow(true);
+    }
+  }
+
+  _getTile(entityId) {
+    return this._tiles?.get(entityId)?.el || null;
   }
 
   _renderItem(fav) {
     const domain = fav.entity_id.split('.')[0];
-    const entity = this._hass?.states[fav.entity_id];
+    const entity = this._getState(fav.entity_id);
 
     if (domain === 'climate') {
       return this._renderClimateItem(fav, entity);
@@ -2100,78 +2571,80 @@ class FavoritesGridCard extends HTMLElement {
     `;
   }
 
-  _attachEventListeners() {
+  _attachItemListeners(el) {
     const allowReorder = this._config.allow_reorder !== false;
 
-    this.shadowRoot.querySelectorAll('.light-item').forEach(el => {
+    if (el.classList.contains('light-item')) {
       el.addEventListener('click', (e) => {
         if (!this._draggedItem) {
           this._toggleLight(el.dataset.entity, e);
         }
       });
-    });
+    }
 
-    this.shadowRoot.querySelectorAll('.standard-item').forEach(el => {
+    if (el.classList.contains('standard-item')) {
       el.addEventListener('click', (e) => {
         if (!this._draggedItem) {
           this._toggleEntity(el.dataset.entity);
         }
       });
-    });
+    }
+
+    this._attachTileControls(el);
+
+    if (allowReorder) {
+      el.addEventListener('dragstart', (e) => this._handleDragStart(e, el.dataset.entity));
+      el.addEventListener('dragend', (e) => this._handleDragEnd(e));
+      el.addEventListener('dragover', (e) => this._handleDragOver(e, el.dataset.entity));
+      el.addEventListener('drop', (e) => this._handleDrop(e, el.dataset.entity));
+    }
+
+    el.addEventListener('pointerdown', (e) => this._handlePointerDown(e, el));
+    el.addEventListener('pointermove', (e) => this._handlePointerMove(e));
+    el.addEventListener('pointerup', (e) => this._handlePointerUp(e));
+    el.addEventListener('pointercancel', (e) => this._handlePointerUp(e));
+    el.addEventListener('pointerleave', (e) => this._handlePointerUp(e));
+  }
 
-    this.shadowRoot.querySelectorAll('.climate-icon-btn').forEach(btn => {
+  _attachTileControls(el) {
+    el.querySelectorAll('.climate-icon-btn').forEach(btn => {
       btn.addEventListener('click', (e) => {
         this._toggleClimateDropdown(btn.dataset.entity, e);
       });
     });
 
-    this.shadowRoot.querySelectorAll('.hvac-option').forEach(opt => {
+    el.querySelectorAll('.hvac-option').forEach(opt => {
       opt.addEventListener('click', (e) => {
         this._setHvacMode(opt.dataset.entity, opt.dataset.mode, e);
       });
     });
 
-    this.shadowRoot.querySelectorAll('.fan-mode-btn').forEach(btn => {
+    el.querySelectorAll('.fan-mode-btn').forEach(btn => {
       btn.addEventListener('click', (e) => {
         this._toggleFanDropdown(btn.dataset.entity, e);
       });
     });
 
-    this.shadowRoot.querySelectorAll('.fan-option').forEach(opt => {
+    el.querySelectorAll('.fan-option').forEach(opt => {
       opt.addEventListener('click', (e) => {
         this._setFanMode(opt.dataset.entity, opt.dataset.fanMode, e);
       });
     });
 
-    this.shadowRoot.querySelectorAll('.temp-btn').forEach(btn => {
+    el.querySelectorAll('.temp-btn').forEach(btn => {
       btn.addEventListener('click', (e) => {
         this._climateSetTemp(btn.dataset.entity, parseInt(btn.dataset.delta), e);
       });
     });
 
-    this.shadowRoot.querySelectorAll('.cover-control-btn').forEach(btn => {
+    el.querySelectorAll('.cover-control-btn').forEach(btn => {
       btn.addEventListener('click', (e) => {
         this._coverControl(btn.dataset.entity, btn.dataset.action, e);
       });
     });
+  }
 
-    if (allowReorder) {
-      this.shadowRoot.querySelectorAll('.item').forEach(el => {
-        el.addEventListener('dragstart', (e) => this._handleDragStart(e, el.dataset.entity));
-        el.addEventListener('dragend', (e) => this._handleDragEnd(e));
-        el.addEventListener('dragover', (e) => this._handleDragOver(e, el.dataset.entity));
-        el.addEventListener('drop', (e) => this._handleDrop(e, el.dataset.entity));
-      });
-    }
-
-    this.shadowRoot.querySelectorAll('.item').forEach(el => {
-      el.addEventListener('pointerdown', (e) => this._handlePointerDown(e, el));
-      el.addEventListener('pointermove', (e) => this._handlePointerMove(e));
-      el.addEventListener('pointerup', (e) => this._handlePointerUp(e));
-      el.addEventListener('pointercancel', (e) => this._handlePointerUp(e));
-      el.addEventListener('pointerleave', (e) => this._handlePointerUp(e));
-    });
-
+  _attachEventListeners() {
     const overlay = this.shadowRoot.querySelector('.rename-overlay');
     if (overlay) {
       overlay.addEventListener('click', (e) => {
@@ -2274,7 +2747,7 @@ class FavoritesGridCard extends HTMLElement {
     this._renameEntityId = entityId;
 
     const fav = this._favorites.find(f => f.entity_id === entityId);
-    const entity = this._hass?.states[entityId];
+    const entity = this._getState(entityId);
     const currentName = fav?.custom_name || entity?.attributes?.friendly_name || entityId.split('.')[1].replace(/_/g, ' ');
 
     const overlay = this.shadowRoot.querySelector('.rename-overlay');
@@ -2317,7 +2790,7 @@ class FavoritesGridCard extends HTMLElement {
     const fav = this._favorites.find(f => f.entity_id === this._renameEntityId);
     if (fav) {
       fav.custom_name = newName;
-      const item = this.shadowRoot.querySelector(`[data-entity="${this._renameEntityId}"]`);
+      const item = this._getTile(this._renameEntityId);
       const nameEl = item?.querySelector('.name, .climate-name, .cover-name');
       if (nameEl) nameEl.textContent = newName;
     }
@@ -2342,12 +2815,12 @@ class FavoritesGridCard extends HTMLElement {
     }
 
     const fav = this._favorites.find(f => f.entity_id === this._renameEntityId);
-    const entity = this._hass?.states[this._renameEntityId];
+    const entity = this._getState(this._renameEntityId);
     const defaultName = entity?.attributes?.friendly_name || this._renameEntityId.split('.')[1].replace(/_/g, ' ');
 
     if (fav) {
       fav.custom_name = null;
-      const item = this.shadowRoot.querySelector(`[data-entity="${this._renameEntityId}"]`);
+      const item = this._getTile(this._renameEntityId);
       const nameEl = item?.querySelector('.name, .climate-name, .cover-name');
       if (nameEl) nameEl.textContent = defaultName;
     }
@@ -2366,10 +2839,17 @@ class FavoritesGridCard extends HTMLElement {
   }
 
   getCardSize() {
+    if (this._config.virtualize) {
+      return Math.ceil((this._config.virtual_height || 600) / 50) + 1;
+    }
     return Math.ceil(this._favorites.length / (this._config.columns || 2)) * 2 + 1;
   }
 }
 
+FavoritesGridCard._styleSheets = new Map();
+FavoritesGridCard._supportsAdoptedStyleSheets =
+  'adoptedStyleSheets' in Document.prototype && 'replaceSync' in CSSStyleSheet.prototype;
+
 if (!customElements.get('favorites-grid-card')) {
   customElements.define('favorites-grid-card', FavoritesGridCard);
 }